@@ -9,6 +9,8 @@ from simanalysis.parsers.dbpf import DBPFReader
 
 logger = logging.getLogger(__name__)
 
+_INSTANCE_ID = struct.Struct("<Q")
+
 
 class MeshAnalyzer:
     """
@@ -145,7 +147,7 @@ class MeshAnalyzer:
                         # Format: Type (4) + Group (4) + Instance (8)
                         # We already matched Type.
                         # group = struct.unpack("<I", data[index+4:index+8])[0]
-                        instance = struct.unpack("<Q", data[index + 8 : index + 16])[0]
+                        (instance,) = _INSTANCE_ID.unpack_from(data, index + 8)
 
                         results.append((mod, target_type, instance))
 
@@ -1,9 +1,10 @@
 """Complete mod analysis pipeline integrating scanning and conflict detection."""
 
+import os
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Optional, TextIO, Union
 
 from simanalysis import __version__
 from simanalysis.analyzers.mesh_analyzer import MeshAnalyzer
@@ -23,6 +24,9 @@ from simanalysis.models import (
 )
 from simanalysis.scanners import ModScanner
 
+# Where export_report writes: a filesystem path or an open text stream
+_ReportTarget = Union[str, "os.PathLike[str]", TextIO]
+
 
 class ModAnalyzer:
     """
@@ -45,6 +49,8 @@ class ModAnalyzer:
         parse_scripts: bool = True,
         calculate_hashes: bool = True,
         detectors: Optional[list[ConflictDetector]] = None,
+        workers: Optional[int] = None,
+        script_cache_dir: Optional[Path] = None,
     ) -> None:
         """
         Initialize mod analyzer.
@@ -54,11 +60,17 @@ class ModAnalyzer:
             parse_scripts: Whether to analyze script files
             calculate_hashes: Whether to calculate file hashes
             detectors: Custom list of conflict detectors (uses defaults if None)
+            workers: Number of worker processes used to scan files (sequential if
+                None or 1)
+            script_cache_dir: Directory for cached script analysis results (no
+                caching if None)
         """
         self.scanner = ModScanner(
             parse_tunings=parse_tunings,
             parse_scripts=parse_scripts,
             calculate_hashes=calculate_hashes,
+            workers=workers,
+            script_cache_dir=script_cache_dir,
         )
 
         # Use default detectors if none provided
@@ -339,13 +351,18 @@ class ModAnalyzer:
 
         return recommendations
 
-    def export_report(self, result: AnalysisResult, output_path: Path, format: str = "txt") -> None:
+    def export_report(
+        self,
+        result: AnalysisResult,
+        output_path: _ReportTarget,
+        format: str = "txt",
+    ) -> None:
         """
         Export analysis report to file.
 
         Args:
             result: Analysis result to export
-            output_path: Path to output file
+            output_path: Path to output file, or an open text stream to write to
             format: Report format (txt, json, html)
         """
         if format == "txt":
@@ -355,7 +372,7 @@ class ModAnalyzer:
         else:
             raise ValueError(f"Unsupported format: {format}")
 
-    def _export_text_report(self, result: AnalysisResult, output_path: Path) -> None:
+    def _export_text_report(self, result: AnalysisResult, output_path: _ReportTarget) -> None:
         """Export plain text report."""
         lines: list[str] = []
 
@@ -406,10 +423,9 @@ class ModAnalyzer:
                         if conflict.resolution:
                             lines.append(f"  Resolution: {conflict.resolution}")
 
-        # Write file
-        output_path.write_text("\n".join(lines), encoding="utf-8")
+        self._write_report("\n".join(lines), output_path)
 
-    def _export_json_report(self, result: AnalysisResult, output_path: Path) -> None:
+    def _export_json_report(self, result: AnalysisResult, output_path: _ReportTarget) -> None:
         """Export JSON report."""
         import json
 
@@ -417,6 +433,12 @@ class ModAnalyzer:
 
         report = serialization.mod_result_to_dict(self, result)
 
-        # Write file
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2)
+        self._write_report(json.dumps(report, indent=2), output_path)
+
+    @staticmethod
+    def _write_report(content: str, output_path: _ReportTarget) -> None:
+        """Write rendered report content to a path or an open text stream."""
+        if isinstance(output_path, (str, os.PathLike)):
+            Path(output_path).write_text(content, encoding="utf-8")
+        else:
+            output_path.write(content)
@@ -104,9 +104,11 @@ class SaveAnalyzer:
 
         # Map: Resource Key -> List of mod files containing it
         resource_to_mods: dict[ResourceKey, list[Mod]] = {}
+        # resource_keys builds a fresh set on each access; build each mod's once
+        mod_key_sets = [mod.resource_keys for mod in mods]
 
-        for mod in mods:
-            for resource_key in mod.resource_keys:
+        for mod, mod_resource_keys in zip(mods, mod_key_sets):
+            for resource_key in mod_resource_keys:
                 if resource_key not in resource_to_mods:
                     resource_to_mods[resource_key] = []
                 resource_to_mods[resource_key].append(mod)
@@ -133,12 +135,8 @@ class SaveAnalyzer:
         )
 
         # Categorize mods as used or unused
-        for mod in mods:
-            matching_res: set[ResourceKey] = set()
-            mod_resource_keys = mod.resource_keys
-            for res_key in save_data.referenced_resources:
-                if res_key in mod_resource_keys:
-                    matching_res.add(res_key)
+        for mod, mod_resource_keys in zip(mods, mod_key_sets):
+            matching_res = save_data.referenced_resources & mod_resource_keys
 
             mod_file = ModFile(
                 path=mod.path,
@@ -1,5 +1,6 @@
 """Command-line interface for Simanalysis."""
 
+import os
 import sys
 from pathlib import Path
 from typing import Any, Optional
@@ -94,6 +95,19 @@ def cli() -> None:
     is_flag=True,
     help="Show detailed mod list (TUI mode only)",
 )
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes for scanning (default: CPU count; 1 scans sequentially)",
+)
+@click.option(
+    "--script-cache",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Cache script analysis in this directory so unchanged scripts are not re-parsed",
+)
 def analyze(
     mods_directory: str,
     output: Optional[str],
@@ -106,6 +120,8 @@ def analyze(
     tui: bool,
     interactive: bool,
     show_mods: bool,
+    workers: Optional[int],
+    script_cache: Optional[str],
 ) -> None:
     """
     Analyze Sims 4 mods directory for conflicts and issues.
@@ -120,6 +136,9 @@ def analyze(
     MODS_DIRECTORY: Path to your Sims 4 Mods folder
     """
     mods_path = Path(mods_directory).expanduser().resolve()
+    if workers is None:
+        workers = os.cpu_count() or 1
+    script_cache_path = Path(script_cache).expanduser().resolve() if script_cache else None
 
     # Use Interactive TUI if requested
     if interactive:
@@ -131,6 +150,8 @@ def analyze(
             parse_scripts=not no_scripts,
             calculate_hashes=not quick,
             recursive=recursive,
+            workers=workers,
+            script_cache_dir=script_cache_path,
         )
         return
 
@@ -145,6 +166,8 @@ def analyze(
             calculate_hashes=not quick,
             recursive=recursive,
             show_mods=show_mods,
+            workers=workers,
+            script_cache_dir=script_cache_path,
         )
 
         # Export if requested
@@ -171,7 +194,8 @@ def analyze(
         click.echo(f"   Parse tunings: {not no_tunings}")
         click.echo(f"   Parse scripts: {not no_scripts}")
         click.echo(f"   Calculate hashes: {not quick}")
-        click.echo(f"   Recursive: {recursive}\n")
+        click.echo(f"   Recursive: {recursive}")
+        click.echo(f"   Workers: {workers}\n")
     else:
         click.echo(f"🔬 Analyzing {mods_path}...")
 
@@ -180,6 +204,8 @@ def analyze(
         parse_tunings=not no_tunings,
         parse_scripts=not no_scripts,
         calculate_hashes=not quick,
+        workers=workers,
+        script_cache_dir=script_cache_path,
     )
 
     # Run analysis with progress indication
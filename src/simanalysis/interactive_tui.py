@@ -482,6 +482,8 @@ class SimanalysisApp(App):
         parse_scripts: bool = True,
         calculate_hashes: bool = True,
         recursive: bool = True,
+        workers: Optional[int] = None,
+        script_cache_dir: Optional[Path] = None,
     ):
         super().__init__()
         self.mods_directory = mods_directory
@@ -489,6 +491,8 @@ class SimanalysisApp(App):
         self.parse_scripts = parse_scripts
         self.calculate_hashes = calculate_hashes
         self.recursive = recursive
+        self.scan_workers = workers
+        self.script_cache_dir = script_cache_dir
         self.result: Optional[AnalysisResult] = None
 
     def on_mount(self) -> None:
@@ -503,6 +507,8 @@ class SimanalysisApp(App):
             parse_tunings=self.parse_tunings,
             parse_scripts=self.parse_scripts,
             calculate_hashes=self.calculate_hashes,
+            workers=self.scan_workers,
+            script_cache_dir=self.script_cache_dir,
         )
 
         self.result = analyzer.analyze_directory(
@@ -525,6 +531,8 @@ def run_interactive_tui(
     parse_scripts: bool = True,
     calculate_hashes: bool = True,
     recursive: bool = True,
+    workers: Optional[int] = None,
+    script_cache_dir: Optional[Path] = None,
 ) -> None:
     """
     Run the interactive TUI application.
@@ -535,6 +543,8 @@ def run_interactive_tui(
         parse_scripts: Whether to analyze scripts
         calculate_hashes: Whether to calculate file hashes
         recursive: Whether to scan recursively
+        workers: Number of worker processes used to scan files
+        script_cache_dir: Directory for cached script analysis results
     """
     app = SimanalysisApp(
         mods_directory=mods_directory,
@@ -542,5 +552,7 @@ def run_interactive_tui(
         parse_scripts=parse_scripts,
         calculate_hashes=calculate_hashes,
         recursive=recursive,
+        workers=workers,
+        script_cache_dir=script_cache_dir,
     )
     app.run()
@@ -1,13 +1,20 @@
 """Data models for Simanalysis."""
 
+import sys
+from collections.abc import Mapping
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional
 
 from simanalysis.formats.types import MODL, PNG_IMAGE, SIMDATA, STBL, TUNING_GENERIC
 
+# ``slots=True`` needs Python 3.10+; on 3.9 these models fall back to a per-instance __dict__.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class ModType(Enum):
     """Type of mod."""
@@ -59,9 +66,9 @@ class DBPFHeader:
             raise ValueError(f"Unsupported DBPF version: {self.major_version}")
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class DBPFResource:
-    """Individual resource entry in DBPF package."""
+    """Individual resource entry in DBPF package (immutable, hashable)."""
 
     type: int  # Resource type (4 bytes)
     group: int  # Resource group (4 bytes)
@@ -201,17 +208,45 @@ class UIAnalysisResult:
     index_errors: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class TuningData:
-    """Parsed tuning file data."""
+    """
+    Parsed tuning file data.
+
+    Parse results are shared between mods that ship the same payload, so the
+    containers are frozen copies: a read-only mapping and frozensets.
+    """
 
     instance_id: int
     tuning_name: str
     tuning_class: str
     module: str
-    modified_attributes: dict[str, Any] = field(default_factory=dict)
-    references: set[int] = field(default_factory=set)
-    pack_requirements: set[str] = field(default_factory=set)
+    modified_attributes: Mapping[str, Any] = field(default_factory=dict)
+    references: AbstractSet[int] = frozenset()
+    pack_requirements: AbstractSet[str] = frozenset()
+
+    def __post_init__(self) -> None:
+        """Freeze the containers so a shared instance cannot be changed in place."""
+        object.__setattr__(
+            self, "modified_attributes", MappingProxyType(dict(self.modified_attributes))
+        )
+        object.__setattr__(self, "references", frozenset(self.references))
+        object.__setattr__(self, "pack_requirements", frozenset(self.pack_requirements))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle via the constructor, since mapping proxies cannot be pickled."""
+        return (
+            TuningData,
+            (
+                self.instance_id,
+                self.tuning_name,
+                self.tuning_class,
+                self.module,
+                dict(self.modified_attributes),
+                self.references,
+                self.pack_requirements,
+            ),
+        )
 
 
 @dataclass
@@ -338,9 +373,9 @@ class SimDataData:
         return len(self.schemas)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Mod:
-    """Represents a single mod."""
+    """Represents a single mod (frozen: fields cannot be reassigned once scanned)."""
 
     name: str
     path: Path
@@ -349,7 +384,7 @@ class Mod:
     hash: Optional[str]
 
     # Parsed data
-    resources: list[DBPFResource] = field(default_factory=list)
+    resources: tuple[DBPFResource, ...] = ()
     tunings: list[TuningData] = field(default_factory=list)
     scripts: list[ScriptModule] = field(default_factory=list)
     string_tables: list[StringTableData] = field(default_factory=list)
@@ -369,7 +404,8 @@ class Mod:
     @property
     def resource_keys(self) -> set[tuple[int, int, int]]:
         """Get all resource keys (Type, Group, Instance) in this mod."""
-        return {resource.key for resource in self.resources}
+        # Same tuples as DBPFResource.key, built inline to skip a property call each
+        return {(resource.type, resource.group, resource.instance) for resource in self.resources}
 
 
 @dataclass
@@ -8,6 +8,8 @@ Format specification: https://simswiki.info/DatabasePackedFile
 
 from __future__ import annotations
 
+import mmap
+import os
 import struct
 import zlib
 from pathlib import Path
@@ -15,6 +17,15 @@ from pathlib import Path
 from simanalysis.exceptions import DBPFError
 from simanalysis.models import DBPFHeader, DBPFResource
 
+# Header fields read by DBPFReader: magic, major/minor/user version (0-15),
+# index count/offset/size (36-47) and the extended index offset (64-67)
+_HEADER = struct.Struct("<4s3I20x3I16xI")
+_U32 = struct.Struct("<I")
+
+# Cap on the output buffer preallocated from an index entry's declared size, so a
+# corrupt entry can't request gigabytes before anything is inflated
+_MAX_DECOMPRESS_BUFSIZE = 64 << 20
+
 
 class DBPFReader:
     """
@@ -30,6 +41,12 @@ class DBPFReader:
         >>> header = reader.read_header()
         >>> resources = reader.read_index()
         >>> tuning_resources = reader.get_resources_by_type(0x03B33DDF)
+
+        Used as a context manager, the reader maps the package once and serves
+        every read from the mapping instead of reopening the file:
+
+        >>> with DBPFReader("my_mod.package") as reader:
+        ...     data = [reader.get_resource(r) for r in reader.resources]
     """
 
     # DBPF format constants
@@ -51,14 +68,39 @@ class DBPFReader:
         """
         self.path = Path(package_path)
 
-        if not self.path.exists():
-            raise FileNotFoundError(f"Package file not found: {self.path}")
-
+        # One stat for the common case; only a non-file needs the second check
         if not self.path.is_file():
+            if not self.path.exists():
+                raise FileNotFoundError(f"Package file not found: {self.path}")
             raise DBPFError(f"Path is not a file: {self.path}")
 
         self._header: DBPFHeader | None = None
         self._resources: list[DBPFResource] | None = None
+        self._mmap: mmap.mmap | None = None
+
+    def __enter__(self) -> DBPFReader:
+        with open(self.path, "rb") as f:
+            # Empty files cannot be mapped; read_header reports them as too small
+            if os.fstat(f.fileno()).st_size:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the package, if it was mapped by entering the reader."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _read(self, offset: int, size: int) -> bytes:
+        """Read up to ``size`` bytes at ``offset``, from the mapping when there is one."""
+        if self._mmap is not None:
+            return self._mmap[offset : offset + size]
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return f.read(size)
 
     def read_header(self) -> DBPFHeader:
         """
@@ -70,72 +112,52 @@ class DBPFReader:
         Raises:
             DBPFError: If header is invalid or corrupted
         """
-        with open(self.path, "rb") as f:
-            header_data = f.read(self.HEADER_SIZE)
+        header_data = self._read(0, self.HEADER_SIZE)
 
-            if len(header_data) < self.HEADER_SIZE:
-                raise DBPFError(
-                    f"File too small: expected at least {self.HEADER_SIZE} bytes, "
-                    f"got {len(header_data)}"
-                )
+        if len(header_data) < self.HEADER_SIZE:
+            raise DBPFError(
+                f"File too small: expected at least {self.HEADER_SIZE} bytes, "
+                f"got {len(header_data)}"
+            )
 
-            try:
-                # Parse header fields
-                # Format: 4s = magic (4 bytes)
-                #         I = major_version (4 bytes unsigned)
-                #         I = minor_version (4 bytes unsigned)
-                #         I = user_version (4 bytes unsigned)
-                #         I = flags (4 bytes, skip)
-                #         I = created_date (4 bytes, skip)
-                #         I = modified_date (4 bytes, skip)
-                #         I = index_version (4 bytes, skip)
-                #         I = index_count (4 bytes unsigned)
-                #         I = index_offset (4 bytes unsigned)
-                #         I = index_size (4 bytes unsigned)
-                #         ... (rest of header)
-
-                magic = header_data[0:4]
-                major_version = struct.unpack("<I", header_data[4:8])[0]
-                minor_version = struct.unpack("<I", header_data[8:12])[0]
-                user_version = struct.unpack("<I", header_data[12:16])[0]
-
-                # Skip flags, dates, index_version (24 bytes)
-                # DBPF 2.1 Header Layout:
-                # 36: Index Count
-                # 40: Unused? (0)
-                # 44: Index Size
-                # 64: Index Offset
-
-                index_count = struct.unpack("<I", header_data[36:40])[0]
-                index_size = struct.unpack("<I", header_data[44:48])[0]
-
-                # Try standard offset first, if 0 check extended offset
-                index_offset = struct.unpack("<I", header_data[40:44])[0]
-                if index_offset == 0:
-                    index_offset = struct.unpack("<I", header_data[64:68])[0]
-
-                # Get file size
-                file_size = self.path.stat().st_size
-
-                header = DBPFHeader(
-                    magic=magic,
-                    major_version=major_version,
-                    minor_version=minor_version,
-                    user_version=user_version,
-                    index_count=index_count,
-                    index_offset=index_offset,
-                    index_size=index_size,
-                    file_size=file_size,
-                )
+        try:
+            (
+                magic,
+                major_version,
+                minor_version,
+                user_version,
+                index_count,
+                index_offset,
+                index_size,
+                extended_index_offset,
+            ) = _HEADER.unpack_from(header_data)
+
+            # Try standard offset first, if 0 use the DBPF 2.1 extended offset
+            if index_offset == 0:
+                index_offset = extended_index_offset
+
+            # Get file size; a mapped package already knows it
+            file_size = len(self._mmap) if self._mmap is not None else self.path.stat().st_size
+
+            header = DBPFHeader(
+                magic=magic,
+                major_version=major_version,
+                minor_version=minor_version,
+                user_version=user_version,
+                index_count=index_count,
+                index_offset=index_offset,
+                index_size=index_size,
+                file_size=file_size,
+            )
 
-                self._header = header
-                return header
+            self._header = header
+            return header
 
-            except struct.error as e:
-                raise DBPFError(f"Failed to parse DBPF header: {e}") from e
-            except ValueError as e:
-                # Raised by DBPFHeader validation
-                raise DBPFError(f"Invalid DBPF header: {e}") from e
+        except struct.error as e:
+            raise DBPFError(f"Failed to parse DBPF header: {e}") from e
+        except ValueError as e:
+            # Raised by DBPFHeader validation
+            raise DBPFError(f"Invalid DBPF header: {e}") from e
 
     def read_index(self) -> list[DBPFResource]:
         """
@@ -158,12 +180,8 @@ class DBPFReader:
         if self._header is None:
             self._header = self.read_header()
 
-        with open(self.path, "rb") as f:
-            # Seek to index table
-            f.seek(self._header.index_offset)
-
-            # Read entire index table
-            index_data = f.read(self._header.index_size)
+        # Read entire index table
+        index_data = self._read(self._header.index_offset, self._header.index_size)
 
         if len(index_data) < self._header.index_size:
             raise DBPFError(
@@ -176,62 +194,60 @@ class DBPFReader:
 
         zlib_compression = 0x5A42  # value of the per-entry "compressed" field for zlib
 
-        pos = 0
-
-        def _u32() -> int:
-            nonlocal pos
-            value: int = struct.unpack_from("<I", index_data, pos)[0]
-            pos += 4
-            return value
-
-        def _u16() -> int:
-            nonlocal pos
-            value: int = struct.unpack_from("<H", index_data, pos)[0]
-            pos += 2
-            return value
-
-        index_type = _u32()
+        (index_type,) = _U32.unpack_from(index_data)
         if index_type & ~0x7:
             # Only the low three bits (Type/Group/InstanceHi constant) are defined
             # for Sims 4 packages; anything else is a layout we don't model.
             raise DBPFError(f"Unsupported index flags: {index_type:#010x}")
 
         # Constant fields are stored once, right after the flags word.
-        const_type = _u32() if index_type & 0x1 else None
-        const_group = _u32() if index_type & 0x2 else None
-        const_instance_hi = _u32() if index_type & 0x4 else None
+        pos = 4
+        const_values: list[int | None] = []
+        for flag in (0x1, 0x2, 0x4):
+            if not index_type & flag:
+                const_values.append(None)
+                continue
+            if pos + 4 > len(index_data):
+                raise DBPFError("Index table too small to contain its constant fields")
+            const_values.append(_U32.unpack_from(index_data, pos)[0])
+            pos += 4
+        const_type, const_group, const_instance_hi = const_values
+
+        # Each entry holds the non-constant key fields, then instanceLo, chunk
+        # offset, file size, mem size, compression and committed flag.
+        entry = struct.Struct("<" + "I" * const_values.count(None) + "4I2H")
+        end = pos + self._header.index_count * entry.size
+        if end > len(index_data):
+            raise DBPFError(
+                f"Failed to parse index entry {(len(index_data) - pos) // entry.size}: "
+                f"index table is {len(index_data)} bytes, entries need {end}"
+            )
 
         resources: list[DBPFResource] = []
-        try:
-            for _ in range(self._header.index_count):
-                res_type = const_type if const_type is not None else _u32()
-                res_group = const_group if const_group is not None else _u32()
-                instance_hi = const_instance_hi if const_instance_hi is not None else _u32()
-                instance_lo = _u32()
-                chunk_offset = _u32()
-                file_size = _u32() & 0x7FFFFFFF  # high bit is a flag, not part of the size
-                mem_size = _u32()
-                compression = _u16()
-                _u16()  # committed flag (unused)
-
-                resources.append(
-                    DBPFResource(
-                        type=res_type,
-                        group=res_group,
-                        instance=(instance_hi << 32) | instance_lo,
-                        offset=chunk_offset,
-                        size=mem_size,
-                        # Record the on-disk size only when zlib-compressed, so that
-                        # DBPFResource.is_compressed and get_resource() do the right thing.
-                        compressed_size=file_size if compression == zlib_compression else 0,
-                    )
+        for fields in entry.iter_unpack(memoryview(index_data)[pos:end]):
+            *key, instance_lo, chunk_offset, file_size, mem_size, compression, _ = fields
+            varying = iter(key)
+            res_type = const_type if const_type is not None else next(varying)
+            res_group = const_group if const_group is not None else next(varying)
+            instance_hi = const_instance_hi if const_instance_hi is not None else next(varying)
+            file_size &= 0x7FFFFFFF  # high bit is a flag, not part of the size
+
+            resources.append(
+                DBPFResource(
+                    type=res_type,
+                    group=res_group,
+                    instance=(instance_hi << 32) | instance_lo,
+                    offset=chunk_offset,
+                    size=mem_size,
+                    # Record the on-disk size only when zlib-compressed, so that
+                    # DBPFResource.is_compressed and get_resource() do the right thing.
+                    compressed_size=file_size if compression == zlib_compression else 0,
                 )
-        except struct.error as e:
-            raise DBPFError(f"Failed to parse index entry {len(resources)}: {e}") from e
+            )
 
-        if pos != len(index_data):
+        if end != len(index_data):
             raise DBPFError(
-                f"Index parse consumed {pos} of {len(index_data)} bytes "
+                f"Index parse consumed {end} of {len(index_data)} bytes "
                 f"(index_count={self._header.index_count}, flags={index_type:#x}); "
                 "unexpected index layout"
             )
@@ -252,36 +268,33 @@ class DBPFReader:
         Raises:
             DBPFError: If resource cannot be read
         """
-        with open(self.path, "rb") as f:
-            # Seek to resource offset
-            f.seek(resource.offset)
+        # Determine how much to read
+        read_size = resource.compressed_size if resource.is_compressed else resource.size
 
-            # Determine how much to read
-            read_size = resource.compressed_size if resource.is_compressed else resource.size
+        # Read resource data
+        data = self._read(resource.offset, read_size)
 
-            # Read resource data
-            data = f.read(read_size)
-
-            if len(data) < read_size:
-                raise DBPFError(
-                    f"Could not read complete resource: expected {read_size} bytes, got {len(data)}"
-                )
+        if len(data) < read_size:
+            raise DBPFError(
+                f"Could not read complete resource: expected {read_size} bytes, got {len(data)}"
+            )
 
-            # Decompress if necessary
-            if resource.is_compressed:
-                try:
-                    # DBPF uses zlib compression
-                    data = zlib.decompress(data)
+        # Decompress if necessary
+        if resource.is_compressed:
+            try:
+                # DBPF uses zlib compression; the index gives the inflated size, so
+                # size the output buffer once (up to the cap) instead of growing it
+                data = zlib.decompress(data, bufsize=min(resource.size, _MAX_DECOMPRESS_BUFSIZE))
 
-                    if len(data) != resource.size:
-                        raise DBPFError(
-                            f"Decompressed size mismatch: expected {resource.size}, got {len(data)}"
-                        )
+                if len(data) != resource.size:
+                    raise DBPFError(
+                        f"Decompressed size mismatch: expected {resource.size}, got {len(data)}"
+                    )
 
-                except zlib.error as e:
-                    raise DBPFError(f"Failed to decompress resource: {e}") from e
+            except zlib.error as e:
+                raise DBPFError(f"Failed to decompress resource: {e}") from e
 
-            return data
+        return data
 
     def get_resources_by_type(self, type_id: int) -> list[DBPFResource]:
         """
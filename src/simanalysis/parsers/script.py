@@ -12,13 +12,94 @@ This module provides tools to analyze these scripts for:
 from __future__ import annotations
 
 import ast
+import contextlib
+import dataclasses
+import hashlib
+import json
+import re
 import zipfile
 from pathlib import Path
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from simanalysis.exceptions import ScriptError
 from simanalysis.models import ScriptMetadata, ScriptModule
 
+# Archive members searched, in order, for metadata fields
+_METADATA_FILES = ("metadata.txt", "README.md", "__init__.py")
+_METADATA_HEAD_LINES = 20
+
+# A field matches the first line mentioning its label; the value is everything after
+# that line's first colon
+_NAME_RE = re.compile(r"^(?=.*name:)[^:\n]*:(.*)$", re.IGNORECASE | re.MULTILINE)
+_VERSION_RE = re.compile(r"^(?=.*version:)[^:\n]*:(.*)$", re.IGNORECASE | re.MULTILINE)
+_AUTHOR_RE = re.compile(r"^(?=.*(?:author|creator):)[^:\n]*:(.*)$", re.IGNORECASE | re.MULTILINE)
+
+# Bump when the cached metadata/module layout changes; older entries are then ignored
+_CACHE_SCHEMA_VERSION = 1
+
+# Decorator names containing any of these are reported as hooks
+_DECORATOR_HOOK_WORDS = ("inject", "wrap", "override")
+
+
+# Nodes that each add one branch to a module's complexity score
+_CONTROL_FLOW_NODES = (ast.If, ast.While, ast.For, ast.AsyncFor, ast.Try, ast.ExceptHandler)
+
+
+class _ModuleVisitor:
+    """Collect imports, decorator hooks and complexity in one AST traversal.
+
+    The tree is walked with an explicit stack rather than recursive visit_* calls:
+    generated mods contain elif chains and operator runs deep enough to exceed the
+    interpreter's recursion limit.
+    """
+
+    def __init__(self) -> None:
+        self.imports: set[str] = set()
+        self.decorator_hooks: list[str] = []
+        self.complexity = 0
+
+    def visit(self, tree: ast.AST) -> None:
+        # Pre-order, children left to right: the order NodeVisitor would use
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            self._visit_node(node)
+            stack.extend(reversed(list(ast.iter_child_nodes(node))))
+
+    def _visit_node(self, node: ast.AST) -> None:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                self.imports.add(alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                self.imports.add(node.module)
+        elif isinstance(node, ast.FunctionDef):
+            self.complexity += 1
+            self._collect_decorator_hooks(node)
+        elif isinstance(node, ast.AsyncFunctionDef):
+            self.complexity += 1
+        elif isinstance(node, ast.ClassDef):
+            self.complexity += 2  # Classes are more complex
+        elif isinstance(node, ast.BoolOp):
+            self.complexity += len(node.values) - 1
+        elif isinstance(node, _CONTROL_FLOW_NODES):
+            self.complexity += 1
+
+    def _collect_decorator_hooks(self, node: ast.FunctionDef) -> None:
+        for decorator in node.decorator_list:
+            if isinstance(decorator, ast.Call):
+                decorator = decorator.func
+            if isinstance(decorator, ast.Name) and any(
+                hook in decorator.id for hook in _DECORATOR_HOOK_WORDS
+            ):
+                self.decorator_hooks.append(f"@{decorator.id}")
+
+    @classmethod
+    def scan(cls, tree: ast.AST) -> _ModuleVisitor:
+        visitor = cls()
+        visitor.visit(tree)
+        return visitor
+
 
 class ScriptAnalyzer:
     """
@@ -35,9 +116,9 @@ class ScriptAnalyzer:
     - Code complexity metrics
 
     Example:
-        >>> analyzer = ScriptAnalyzer("my_script.ts4script")
-        >>> metadata = analyzer.extract_metadata()
-        >>> modules = analyzer.list_modules()
+        >>> with ScriptAnalyzer("my_script.ts4script") as analyzer:
+        ...     metadata = analyzer.extract_metadata()
+        ...     modules = analyzer.list_modules()
         >>> print(f"Found {len(modules)} modules")
     """
 
@@ -53,12 +134,14 @@ class ScriptAnalyzer:
         "@wrap",
     ]
 
-    def __init__(self, script_path: Path | str) -> None:
+    def __init__(self, script_path: Path | str, cache_dir: Path | None = None) -> None:
         """
         Initialize script analyzer.
 
         Args:
             script_path: Path to .ts4script file
+            cache_dir: Directory for cached metadata and module results, keyed by
+                the script's path, mtime and size. If None, caching is disabled.
 
         Raises:
             FileNotFoundError: If script file doesn't exist
@@ -76,9 +159,45 @@ class ScriptAnalyzer:
         if not zipfile.is_zipfile(self.path):
             raise ScriptError(f"File is not a valid ZIP archive: {self.path}")
 
+        self.cache_dir = cache_dir
+        if self.cache_dir:
+            # An unusable cache directory only means every lookup misses
+            with contextlib.suppress(OSError):
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._zip: zipfile.ZipFile | None = None
         self._metadata: ScriptMetadata | None = None
         self._modules: list[ScriptModule] | None = None
 
+    def __enter__(self) -> ScriptAnalyzer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the archive handle, if one was opened."""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def __del__(self) -> None:
+        # Fallback for callers that skip ``with``/close(); an open handle locks the file
+        # against moves and deletes on Windows
+        if getattr(self, "_zip", None) is not None:
+            self.close()
+
+    def _close_if_done(self) -> None:
+        """Close the archive once metadata and modules are both cached."""
+        if self._metadata is not None and self._modules is not None:
+            self.close()
+
+    def _archive(self) -> zipfile.ZipFile:
+        """Return the script's archive, opened on first use and shared after that."""
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.path, "r")
+        return self._zip
+
     def extract_metadata(self) -> ScriptMetadata:
         """
         Extract script metadata.
@@ -92,93 +211,70 @@ class ScriptAnalyzer:
         Returns:
             ScriptMetadata with extracted information
         """
-        name = self._extract_name()
-        version = self._extract_version()
-        author = self._extract_author()
+        cached = self._read_cache().get("metadata")
+        if cached is not None:
+            try:
+                self._metadata = ScriptMetadata(**cached)
+            except (TypeError, ValueError):
+                pass  # Entry doesn't fit the current model; parse again
+            else:
+                self._close_if_done()
+                return self._metadata
+
+        heads = self._metadata_heads()
+        name = self._find_field(_NAME_RE, heads)
+        version = self._find_field(_VERSION_RE, heads)
+        author = self._find_field(_AUTHOR_RE, heads)
         requires = self._extract_requirements()
 
         metadata = ScriptMetadata(
-            name=name,
-            version=version,
-            author=author,
+            name=self.path.stem if name is None else name,  # Fallback to filename
+            version="unknown" if version is None else version,
+            author="unknown" if author is None else author,
             requires=requires,
             python_version="3.7",  # Sims 4 uses Python 3.7
         )
 
         self._metadata = metadata
+        self._write_cache("metadata", dataclasses.asdict(metadata))
+        self._close_if_done()
         return metadata
 
-    def _extract_name(self) -> str:
-        """Extract script name from various sources."""
-        # Try to find name in metadata file
-        with zipfile.ZipFile(self.path, "r") as zf:
-            # Look for common metadata files
-            for filename in ["metadata.txt", "README.md", "__init__.py"]:
-                try:
-                    content = zf.read(filename).decode("utf-8", errors="ignore")
-                    # Look for "Name:" or "# Name:" patterns
-                    for line in content.split("\n")[:20]:  # First 20 lines
-                        if "name:" in line.lower():
-                            parts = line.split(":", 1)
-                            if len(parts) == 2:
-                                return parts[1].strip().strip("\"'")
-                except KeyError:
-                    continue
-
-        # Fallback to filename
-        return self.path.stem
-
-    def _extract_version(self) -> str:
-        """Extract script version."""
-        with zipfile.ZipFile(self.path, "r") as zf:
-            # Look for version in metadata files
-            for filename in ["metadata.txt", "README.md", "__init__.py"]:
-                try:
-                    content = zf.read(filename).decode("utf-8", errors="ignore")
-                    for line in content.split("\n")[:20]:
-                        if "version:" in line.lower():
-                            parts = line.split(":", 1)
-                            if len(parts) == 2:
-                                return parts[1].strip().strip("\"'")
-                except KeyError:
-                    continue
-
-        return "unknown"
-
-    def _extract_author(self) -> str:
-        """Extract script author."""
-        with zipfile.ZipFile(self.path, "r") as zf:
-            # Look for author in metadata files
-            for filename in ["metadata.txt", "README.md", "__init__.py"]:
-                try:
-                    content = zf.read(filename).decode("utf-8", errors="ignore")
-                    for line in content.split("\n")[:20]:
-                        if "author:" in line.lower() or "creator:" in line.lower():
-                            parts = line.split(":", 1)
-                            if len(parts) == 2:
-                                return parts[1].strip().strip("\"'")
-                except KeyError:
-                    continue
-
-        return "unknown"
+    def _metadata_heads(self) -> list[str]:
+        """Read the first lines of each metadata file present, in one archive pass."""
+        heads: list[str] = []
+        zf = self._archive()
+        for filename in _METADATA_FILES:
+            try:
+                member = zf.open(filename)
+            except KeyError:
+                continue
+            # Stream just the head; the rest of the member is never decompressed
+            with member:
+                lines = [member.readline() for _ in range(_METADATA_HEAD_LINES)]
+            heads.append(b"".join(lines).decode("utf-8", errors="ignore"))
+        return heads
+
+    @staticmethod
+    def _find_field(pattern: re.Pattern[str], heads: list[str]) -> str | None:
+        """Return the first value ``pattern`` finds across ``heads``, if any."""
+        for head in heads:
+            match = pattern.search(head)
+            if match:
+                return match.group(1).strip().strip("\"'")
+        return None
 
     def _extract_requirements(self) -> list[str]:
         """Extract script requirements/dependencies."""
-        requires: list[str] = []
-
-        with zipfile.ZipFile(self.path, "r") as zf:
-            # Look for requirements
-            if "requirements.txt" in zf.namelist():
-                try:
-                    content = zf.read("requirements.txt").decode("utf-8")
-                    for line in content.split("\n"):
-                        line = line.strip()
-                        if line and not line.startswith("#"):
-                            requires.append(line)
-                except Exception:  # nosec B110 - intentionally skip malformed requirements.txt
-                    pass
-
-        return requires
+        # Look for requirements
+        try:
+            content = self._archive().read("requirements.txt").decode("utf-8")
+        except Exception:  # missing or malformed requirements.txt
+            return []
+
+        # Keep non-empty, non-comment lines
+        lines = (line.strip() for line in content.splitlines())
+        return [line for line in lines if line and not line.startswith("#")]
 
     def list_modules(self) -> list[ScriptModule]:
         """
@@ -190,25 +286,42 @@ class ScriptAnalyzer:
         Raises:
             ScriptError: If modules cannot be read
         """
+        cached = self._read_cache().get("modules")
+        if cached is not None:
+            try:
+                self._modules = [
+                    ScriptModule(**{**entry, "imports": set(entry["imports"])}) for entry in cached
+                ]
+            except (TypeError, ValueError, KeyError):
+                pass  # Entry doesn't fit the current model; parse again
+            else:
+                self._close_if_done()
+                return self._modules
+
         modules: list[ScriptModule] = []
 
         try:
-            with zipfile.ZipFile(self.path, "r") as zf:
-                for filename in zf.namelist():
-                    # Only process .py files (not .pyc)
-                    if filename.endswith(".py"):
-                        try:
-                            module = self.analyze_module(filename)
-                            modules.append(module)
-                        except Exception:  # nosec B112 - skip unanalyzable/corrupt modules
-                            # Skip modules that can't be analyzed
-                            # (They might be bytecode-only or corrupted)
-                            continue
+            zf = self._archive()
+            for info in zf.infolist():
+                # Only process .py files (not .pyc)
+                if info.filename.endswith(".py"):
+                    try:
+                        module = self._analyze_member(zf, info.filename)
+                        modules.append(module)
+                    except Exception:  # nosec B112 - skip unanalyzable/corrupt modules
+                        # Skip modules that can't be analyzed
+                        # (They might be bytecode-only or corrupted)
+                        continue
 
         except Exception as e:
             raise ScriptError(f"Failed to list modules: {e}") from e
 
         self._modules = modules
+        self._write_cache(
+            "modules",
+            [{**dataclasses.asdict(m), "imports": sorted(m.imports)} for m in modules],
+        )
+        self._close_if_done()
         return modules
 
     def analyze_module(self, module_path: str) -> ScriptModule:
@@ -225,51 +338,43 @@ class ScriptAnalyzer:
             ScriptError: If module cannot be analyzed
         """
         try:
-            with zipfile.ZipFile(self.path, "r") as zf:
-                # Read module source code
-                source = zf.read(module_path).decode("utf-8", errors="ignore")
-
-                # Parse with AST
-                try:
-                    tree = ast.parse(source)
-                except SyntaxError:
-                    # If parsing fails, return basic info
-                    return ScriptModule(
-                        name=module_path,
-                        path=module_path,
-                        imports=set(),
-                        hooks=[],
-                        complexity=0,
-                    )
-
-                # Extract information
-                imports = self._extract_imports(tree)
-                hooks = self.detect_hooks(tree, source)
-                complexity = self.calculate_complexity(tree)
-
-                return ScriptModule(
-                    name=module_path,
-                    path=module_path,
-                    imports=imports,
-                    hooks=hooks,
-                    complexity=complexity,
-                )
+            return self._analyze_member(self._archive(), module_path)
 
         except Exception as e:
             raise ScriptError(f"Failed to analyze module {module_path}: {e}") from e
 
-    def _extract_imports(self, tree: ast.AST) -> set[str]:
-        """Extract import statements from AST."""
-        imports: set[str] = set()
+    def _analyze_member(self, zf: zipfile.ZipFile, module_path: str) -> ScriptModule:
+        """Analyze one module from an archive the caller already has open."""
+        # Read module source code
+        source = zf.read(module_path).decode("utf-8", errors="ignore")
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.add(alias.name)
-            elif isinstance(node, ast.ImportFrom) and node.module:
-                imports.add(node.module)
+        # Parse with AST
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            # If parsing fails, return basic info
+            return ScriptModule(
+                name=module_path,
+                path=module_path,
+                imports=set(),
+                hooks=[],
+                complexity=0,
+            )
+
+        # Extract information in a single traversal
+        visitor = _ModuleVisitor.scan(tree)
+
+        return ScriptModule(
+            name=module_path,
+            path=module_path,
+            imports=visitor.imports,
+            hooks=self._merge_hooks(source, visitor.decorator_hooks),
+            complexity=visitor.complexity,
+        )
 
-        return imports
+    def _extract_imports(self, tree: ast.AST) -> set[str]:
+        """Extract import statements from AST."""
+        return _ModuleVisitor.scan(tree).imports
 
     def detect_hooks(self, tree: ast.AST, source: str) -> list[str]:
         """
@@ -282,6 +387,10 @@ class ScriptAnalyzer:
         Returns:
             List of detected hook patterns
         """
+        return self._merge_hooks(source, _ModuleVisitor.scan(tree).decorator_hooks)
+
+    def _merge_hooks(self, source: str, decorator_hooks: list[str]) -> list[str]:
+        """Combine source pattern hooks with decorator hooks, dropping duplicates."""
         hooks: list[str] = []
 
         # Check for common hook patterns in source
@@ -289,31 +398,10 @@ class ScriptAnalyzer:
             if pattern in source:
                 hooks.append(pattern)
 
-        # Check for decorator-based hooks
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                for decorator in node.decorator_list:
-                    if isinstance(decorator, ast.Name):
-                        decorator_name = decorator.id
-                        if any(hook in decorator_name for hook in ["inject", "wrap", "override"]):
-                            hooks.append(f"@{decorator_name}")
-                    elif isinstance(decorator, ast.Call):
-                        if isinstance(decorator.func, ast.Name):
-                            decorator_name = decorator.func.id
-                            if any(
-                                hook in decorator_name for hook in ["inject", "wrap", "override"]
-                            ):
-                                hooks.append(f"@{decorator_name}")
+        hooks.extend(decorator_hooks)
 
         # Remove duplicates while preserving order
-        seen = set()
-        unique_hooks = []
-        for hook in hooks:
-            if hook not in seen:
-                seen.add(hook)
-                unique_hooks.append(hook)
-
-        return unique_hooks
+        return list(dict.fromkeys(hooks))
 
     def calculate_complexity(self, tree: ast.AST) -> int:
         """
@@ -331,26 +419,43 @@ class ScriptAnalyzer:
         Returns:
             Complexity score (higher = more complex)
         """
-        complexity = 0
-
-        for node in ast.walk(tree):
-            # Functions and classes
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                complexity += 1
-            elif isinstance(node, ast.ClassDef):
-                complexity += 2  # Classes are more complex
-
-            # Control flow
-            elif isinstance(
-                node, (ast.If, ast.While, ast.For, ast.AsyncFor, ast.Try, ast.ExceptHandler)
-            ):
-                complexity += 1
-
-            # Boolean operations add complexity
-            elif isinstance(node, ast.BoolOp):
-                complexity += len(node.values) - 1
+        return _ModuleVisitor.scan(tree).complexity
 
-        return complexity
+    def _cache_file(self) -> Path | None:
+        """Return the cache entry for the script's current (path, mtime, size)."""
+        if self.cache_dir is None:
+            return None
+        try:
+            stat = self.path.stat()
+            path = self.path.resolve()
+        except OSError:
+            return None
+        key = f"{_CACHE_SCHEMA_VERSION}\0{path}\0{stat.st_mtime_ns}\0{stat.st_size}"
+        return self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def _read_cache(self) -> dict[str, Any]:
+        """Load the cache entry, treating a missing or unreadable file as empty."""
+        cache_file = self._cache_file()
+        if cache_file is None:
+            return {}
+        try:
+            entry = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(entry, dict) or entry.get("version") != _CACHE_SCHEMA_VERSION:
+            return {}
+        return entry
+
+    def _write_cache(self, section: str, value: Any) -> None:
+        """Store one section of the cache entry; failures only cost a re-parse."""
+        cache_file = self._cache_file()
+        if cache_file is None:
+            return
+        entry = self._read_cache()
+        entry["version"] = _CACHE_SCHEMA_VERSION
+        entry[section] = value
+        with contextlib.suppress(OSError, TypeError, ValueError):
+            cache_file.write_text(json.dumps(entry), encoding="utf-8")
 
     @property
     def module_paths(self) -> list[str]:
@@ -360,8 +465,9 @@ class ScriptAnalyzer:
         Returns:
             List of .py module paths within the archive
         """
-        with zipfile.ZipFile(self.path, "r") as zf:
-            return [name for name in zf.namelist() if name.endswith(".py")]
+        return [
+            info.filename for info in self._archive().infolist() if info.filename.endswith(".py")
+        ]
 
     @property
     def metadata(self) -> ScriptMetadata:
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import re
 import struct
 from typing import ClassVar
 
 from simanalysis.models import SimDataColumn, SimDataData, SimDataSchema, SimDataTable
 
+_NUL = re.compile(b"\0")
+_U32 = struct.Struct("<I")
+_HEADER_FIELDS = struct.Struct("<4i")
+_TABLE_INFO = struct.Struct("<iIiIIiI")
+_SCHEMA_HEADER = struct.Struct("<iIIIiI")
+_COLUMN = struct.Struct("<iIHHIi")
+
 
 class SimDataParser:
     """Read SimData table/schema metadata without decoding row values."""
@@ -16,27 +24,31 @@ class SimDataParser:
     SUPPORTED_VERSIONS: ClassVar[set[int]] = {0x100, 0x101}
     HEADER_SIZE_V100 = 24
     HEADER_SIZE_V101 = 28
-    TABLE_INFO_SIZE = 28
-    SCHEMA_HEADER_SIZE = 24
-    COLUMN_SIZE = 20
+    TABLE_INFO_SIZE = _TABLE_INFO.size
+    SCHEMA_HEADER_SIZE = _SCHEMA_HEADER.size
+    COLUMN_SIZE = _COLUMN.size
     RELOFFSET_NULL = -0x80000000
 
     @classmethod
-    def parse(cls, data: bytes) -> SimDataData:
+    def parse(cls, data: bytes | bytearray | memoryview) -> SimDataData:
         """
         Parse high-level SimData metadata.
 
         This v0 reader intentionally stops at tables, schemas, columns, and
         names. Row values require type-specific decoding and are left for a
         later True Engine slice.
+
+        Any bytes-like buffer is accepted; it is read through a memoryview so
+        callers holding a larger buffer never pay for a copy.
         """
+        data = memoryview(data).cast("B")
         if len(data) < 8:
             return cls._malformed(0, "SimData header is truncated")
 
         if data[:4] != cls.MAGIC:
             return cls._malformed(0, "SimData magic is missing")
 
-        version = struct.unpack_from("<I", data, 4)[0]
+        (version,) = _U32.unpack_from(data, 4)
         if version not in cls.SUPPORTED_VERSIONS:
             return SimDataData(
                 version=version,
@@ -51,10 +63,9 @@ class SimDataParser:
             return cls._malformed(version, "SimData header is truncated")
 
         try:
-            table_header_offset = struct.unpack_from("<i", data, 8)[0]
-            table_count = struct.unpack_from("<i", data, 12)[0]
-            schema_offset = struct.unpack_from("<i", data, 16)[0]
-            schema_count = struct.unpack_from("<i", data, 20)[0]
+            table_header_offset, table_count, schema_offset, schema_count = (
+                _HEADER_FIELDS.unpack_from(data, 8)
+            )
         except struct.error:
             return cls._malformed(version, "SimData header is truncated")
 
@@ -91,20 +102,21 @@ class SimDataParser:
         )
 
     @classmethod
-    def _parse_tables(cls, data: bytes, table_start: int, table_count: int) -> list[SimDataTable]:
+    def _parse_tables(
+        cls, data: memoryview, table_start: int, table_count: int
+    ) -> list[SimDataTable]:
         tables: list[SimDataTable] = []
-        for index in range(table_count):
+        block = cls._block(data, table_start, table_count * cls.TABLE_INFO_SIZE)
+        for index, (
+            name_rel,
+            name_hash,
+            schema_rel,
+            data_type,
+            row_size,
+            row_rel,
+            row_count,
+        ) in enumerate(_TABLE_INFO.iter_unpack(block)):
             pos = table_start + index * cls.TABLE_INFO_SIZE
-            (
-                name_rel,
-                name_hash,
-                schema_rel,
-                data_type,
-                row_size,
-                row_rel,
-                row_count,
-            ) = struct.unpack_from("<iIiIIiI", data, pos)
-
             tables.append(
                 SimDataTable(
                     name=cls._read_relative_string(data, pos, name_rel),
@@ -121,22 +133,21 @@ class SimDataParser:
 
     @classmethod
     def _parse_schemas(
-        cls, data: bytes, schema_start: int, schema_count: int
+        cls, data: memoryview, schema_start: int, schema_count: int
     ) -> tuple[list[SimDataSchema], dict[int, int]]:
         schemas: list[SimDataSchema] = []
         schema_offsets: dict[int, int] = {}
 
-        for index in range(schema_count):
+        block = cls._block(data, schema_start, schema_count * cls.SCHEMA_HEADER_SIZE)
+        for index, (
+            name_rel,
+            name_hash,
+            schema_hash,
+            schema_size,
+            column_rel,
+            column_count,
+        ) in enumerate(_SCHEMA_HEADER.iter_unpack(block)):
             pos = schema_start + index * cls.SCHEMA_HEADER_SIZE
-            (
-                name_rel,
-                name_hash,
-                schema_hash,
-                schema_size,
-                column_rel,
-                column_count,
-            ) = struct.unpack_from("<iIIIiI", data, pos)
-
             column_start = cls._relative_offset(pos + 16, column_rel)
             columns: list[SimDataColumn] = []
             if column_start is not None:
@@ -159,14 +170,14 @@ class SimDataParser:
 
     @classmethod
     def _parse_columns(
-        cls, data: bytes, column_start: int, column_count: int
+        cls, data: memoryview, column_start: int, column_count: int
     ) -> list[SimDataColumn]:
         columns: list[SimDataColumn] = []
-        for index in range(column_count):
+        block = cls._block(data, column_start, column_count * cls.COLUMN_SIZE)
+        for index, (name_rel, name_hash, data_type, flags, offset, schema_rel) in enumerate(
+            _COLUMN.iter_unpack(block)
+        ):
             pos = column_start + index * cls.COLUMN_SIZE
-            name_rel, name_hash, data_type, flags, offset, schema_rel = struct.unpack_from(
-                "<iIHHIi", data, pos
-            )
             columns.append(
                 SimDataColumn(
                     name=cls._read_relative_string(data, pos, name_rel),
@@ -180,17 +191,19 @@ class SimDataParser:
         return columns
 
     @classmethod
-    def _read_relative_string(cls, data: bytes, field_pos: int, relative_offset: int) -> str | None:
+    def _read_relative_string(
+        cls, data: memoryview, field_pos: int, relative_offset: int
+    ) -> str | None:
         absolute = cls._relative_offset(field_pos, relative_offset)
         if absolute is None or absolute < 0 or absolute >= len(data):
             return None
 
-        end = data.find(b"\0", absolute)
-        if end < 0:
+        match = _NUL.search(data, absolute)
+        if match is None:
             return None
 
         try:
-            return data[absolute:end].decode("utf-8")
+            return str(data[absolute : match.start()], "utf-8")
         except UnicodeDecodeError:
             return None
 
@@ -201,7 +214,12 @@ class SimDataParser:
         return field_pos + relative_offset
 
     @staticmethod
-    def _range_in_bounds(data: bytes, start: int, size: int) -> bool:
+    def _block(data: memoryview, start: int, size: int) -> memoryview:
+        """Zero-copy view of a bounds-checked run of fixed-size records."""
+        return data[start : start + size]
+
+    @staticmethod
+    def _range_in_bounds(data: memoryview, start: int, size: int) -> bool:
         return start >= 0 and size >= 0 and start + size <= len(data)
 
     @staticmethod
@@ -6,7 +6,10 @@ This module provides tools to parse these XML files and extract metadata.
 Tuning files define objects, interactions, buffs, traits, and more.
 """
 
+import hashlib
 import re
+import sys
+from collections import OrderedDict
 from typing import Any, Optional
 
 from lxml import etree
@@ -14,6 +17,18 @@ from lxml import etree
 from simanalysis.exceptions import TuningError
 from simanalysis.models import PACK_PREFIXES, TuningData
 
+# Shared parser for untrusted mod XML: no entity expansion, no network fetches
+_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=False)
+
+# Hex numbers that could be tuning IDs (Sims 4 tuning IDs are typically 32-bit)
+_TUNING_ID_RE = re.compile(r"(?:0x)?([0-9A-Fa-f]{8})")
+
+# Any known pack code followed by a path-like separator (EP01:..., EP01/..., EP01.module)
+_PACK_CODE_RE = re.compile(r"\b(" + "|".join(map(re.escape, PACK_PREFIXES)) + r")[:\\/\.]")
+
+# Default number of distinct tuning payloads whose parse results are kept for reuse
+_PARSE_CACHE_SIZE = 4096
+
 
 class TuningParser:
     """
@@ -36,10 +51,26 @@ class TuningParser:
         'buff'
     """
 
+    def __init__(self, cache_size: int = _PARSE_CACHE_SIZE) -> None:
+        """
+        Initialize tuning parser.
+
+        Args:
+            cache_size: Number of distinct payloads whose results are kept for
+                reuse. 0 disables the cache.
+        """
+        self.cache_size = cache_size
+        # Keyed by (length, digest) so cached entries don't keep payloads alive
+        self._cache: OrderedDict[tuple[int, bytes], TuningData] = OrderedDict()
+
     def parse(self, xml_data: bytes) -> TuningData:
         """
         Parse XML tuning data.
 
+        The same tuning is often repackaged into several mods, so this parser
+        returns its earlier result for a payload it has already seen. TuningData
+        freezes its containers, so a shared result cannot be changed in place.
+
         Args:
             xml_data: Raw XML data as bytes
 
@@ -49,9 +80,30 @@ class TuningParser:
         Raises:
             TuningError: If XML is invalid or missing required fields
         """
+        if not self.cache_size or not isinstance(xml_data, bytes):
+            return self._parse(xml_data)
+
+        key = (len(xml_data), hashlib.blake2b(xml_data, digest_size=16).digest())
+        tuning = self._cache.get(key)
+        if tuning is not None:
+            self._cache.move_to_end(key)
+            return tuning
+
+        tuning = self._parse(xml_data)
+        self._cache[key] = tuning
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return tuning
+
+    def clear_cache(self) -> None:
+        """Drop all cached parse results."""
+        self._cache.clear()
+
+    def _parse(self, xml_data: bytes) -> TuningData:
+        """Parse XML tuning data without consulting the result cache."""
         try:
             # Parse XML
-            root = etree.fromstring(xml_data)
+            root = etree.fromstring(xml_data, parser=_XML_PARSER)
 
             # Extract basic metadata
             instance_id = self.get_instance_id(root)
@@ -59,9 +111,8 @@ class TuningParser:
             tuning_class = self.get_tuning_class(root)
             module = self.get_module(root)
 
-            # Extract modifications and references
-            modified_attributes = self.extract_modifications(root)
-            references = self.find_references(root)
+            # Extract modifications and references in one walk of the tree
+            modified_attributes, references = self._scan_elements(root)
             pack_requirements = self.detect_pack_requirements(root)
 
             return TuningData(
@@ -154,7 +205,8 @@ class TuningParser:
             # Try tag name as fallback
             tuning_class = root.tag
 
-        return tuning_class or "unknown"
+        # Thousands of tunings share a handful of classes; keep one copy of each
+        return sys.intern(tuning_class or "unknown")
 
     def get_module(self, root: etree._Element) -> str:
         """
@@ -169,7 +221,7 @@ class TuningParser:
         # Try 'm' attribute (module)
         module = root.get("m")
 
-        return module or "unknown"
+        return sys.intern(module or "unknown")
 
     def extract_modifications(self, root: etree._Element) -> dict[str, Any]:
         """
@@ -181,26 +233,7 @@ class TuningParser:
         Returns:
             Dictionary of modified attributes
         """
-        modifications: dict[str, Any] = {}
-
-        # Walk through all elements and collect attribute modifications
-        for element in root.iter():
-            # Get element name
-            name = element.get("n")
-
-            if name:
-                # Store the text content or attribute value
-                if element.text and element.text.strip():
-                    modifications[name] = element.text.strip()
-                else:
-                    # Check for value in attributes
-                    for attr_name in ["t", "c", "m", "p"]:
-                        attr_value = element.get(attr_name)
-                        if attr_value:
-                            modifications[name] = attr_value
-                            break
-
-        return modifications
+        return self._scan_elements(root)[0]
 
     def find_references(self, root: etree._Element) -> set[int]:
         """
@@ -215,10 +248,40 @@ class TuningParser:
         Returns:
             Set of referenced tuning instance IDs
         """
+        return self._scan_elements(root)[1]
+
+    def _scan_elements(self, root: etree._Element) -> tuple[dict[str, Any], set[int]]:
+        """
+        Collect modified attributes and tuning references in a single tree walk.
+
+        Args:
+            root: XML root element
+
+        Returns:
+            Tuple of (modified attributes, referenced tuning instance IDs)
+        """
+        modifications: dict[str, Any] = {}
         references: set[int] = set()
 
-        # Look for common reference patterns
         for element in root.iter():
+            text = element.text
+
+            # Get element name
+            name = element.get("n")
+            if name:
+                # Attribute names repeat across every tuning of a class
+                name = sys.intern(name)
+                # Store the text content or attribute value
+                if text and text.strip():
+                    modifications[name] = text.strip()
+                else:
+                    # Check for value in attributes
+                    for attr_name in ["t", "c", "m", "p"]:
+                        attr_value = element.get(attr_name)
+                        if attr_value:
+                            modifications[name] = attr_value
+                            break
+
             # Check 't' attribute (type/tuning reference)
             ref = element.get("t")
             if ref:
@@ -228,12 +291,12 @@ class TuningParser:
                     references.add(tuning_id)
 
             # Check for instance references in text
-            if element.text:
-                tuning_id = self._extract_tuning_id(element.text)
+            if text:
+                tuning_id = self._extract_tuning_id(text)
                 if tuning_id:
                     references.add(tuning_id)
 
-        return references
+        return modifications, references
 
     def _extract_tuning_id(self, text: str) -> Optional[int]:
         """
@@ -245,18 +308,10 @@ class TuningParser:
         Returns:
             Tuning ID if found, None otherwise
         """
-        # Look for hex numbers that could be tuning IDs
-        # Sims 4 tuning IDs are typically 32-bit hex numbers
-        hex_pattern = r"(?:0x)?([0-9A-Fa-f]{8})"
-        match = re.search(hex_pattern, text)
-
-        if match:
-            try:
-                return int(match.group(1), 16)
-            except ValueError:
-                return None
+        match = _TUNING_ID_RE.search(text)
 
-        return None
+        # The pattern only captures eight hex digits, so the conversion cannot fail
+        return int(match.group(1), 16) if match else None
 
     def detect_pack_requirements(self, root: etree._Element) -> set[str]:
         """
@@ -278,19 +333,14 @@ class TuningParser:
         # Get all text content
         all_text = etree.tostring(root, encoding="unicode", method="text")
 
-        # Search for pack prefixes
-        for pack_code in PACK_PREFIXES:
-            # Look for pack code in the XML
-            # Common patterns: EP01:..., EP01/..., EP01.module
-            pattern = rf"\b{pack_code}[:\\/\.]"
-            if re.search(pattern, all_text):
-                packs.add(pack_code)
+        # Search for pack prefixes in one pass over the text
+        packs.update(_PACK_CODE_RE.findall(all_text))
 
         # Check module path
-        module = self.get_module(root)
+        module = self.get_module(root).lower()
         if module:
             for pack_code in PACK_PREFIXES:
-                if pack_code.lower() in module.lower():
+                if pack_code.lower() in module:
                     packs.add(pack_code)
 
         return packs
@@ -1,6 +1,9 @@
 """Scanner for discovering and categorizing Sims 4 mods."""
 
 import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -13,6 +16,12 @@ from simanalysis.parsers.simdata import SimDataParser
 from simanalysis.parsers.stbl import STBLParser
 from simanalysis.parsers.tuning import TuningParser
 
+# Below this many files the process pool's start-up cost outweighs the gain
+_MIN_PARALLEL_FILES = 4
+
+# Read size for hashing on Pythons without hashlib.file_digest
+_HASH_CHUNK_SIZE = 1024 * 1024
+
 
 class ModScanner:
     """
@@ -35,6 +44,8 @@ class ModScanner:
         parse_string_tables: bool = True,
         parse_sim_data: bool = True,
         calculate_hashes: bool = True,
+        workers: Optional[int] = None,
+        script_cache_dir: Optional[Path] = None,
     ) -> None:
         """
         Initialize mod scanner.
@@ -45,12 +56,20 @@ class ModScanner:
             parse_string_tables: Whether to parse STBL string table resources
             parse_sim_data: Whether to parse SimData table/schema metadata
             calculate_hashes: Whether to calculate file hashes
+            workers: Number of worker processes for scan_directory. If None or 1,
+                files are scanned sequentially in this process.
+            script_cache_dir: Directory where script metadata and module results
+                are cached between runs. If None, scripts are always re-parsed.
         """
         self.parse_tunings = parse_tunings
         self.parse_scripts = parse_scripts
         self.parse_string_tables = parse_string_tables
         self.parse_sim_data = parse_sim_data
         self.calculate_hashes = calculate_hashes
+        self.workers = workers
+        self.script_cache_dir = script_cache_dir
+        # One parser per scanner, so repackaged tunings are parsed once per scan
+        self.tuning_parser = TuningParser()
         self.mods_scanned = 0
         self.errors_encountered: list[tuple[Path, str]] = []
 
@@ -86,7 +105,6 @@ class ModScanner:
         if extensions is None:
             extensions = {".package", ".ts4script"}
 
-        mods: list[Mod] = []
         self.mods_scanned = 0
         self.errors_encountered = []
 
@@ -95,6 +113,31 @@ class ModScanner:
             progress_callback(0, 0, "Discovering files...")
 
         files = self._find_mod_files(directory, recursive, extensions)
+
+        try:
+            if self.workers and self.workers > 1 and len(files) >= _MIN_PARALLEL_FILES:
+                return self._scan_files_parallel(files, progress_callback)
+            return self._scan_files(files, progress_callback)
+        finally:
+            # Parse results are reused within a scan only; release them once it ends
+            self.tuning_parser.clear_cache()
+
+    def _scan_files(
+        self,
+        files: list[Path],
+        progress_callback: Optional["Callable[[int, int, str], None]"],
+    ) -> list[Mod]:
+        """
+        Scan files one after another in this process.
+
+        Args:
+            files: Mod files to scan
+            progress_callback: Optional callback (current, total, filename)
+
+        Returns:
+            List of discovered mods
+        """
+        mods: list[Mod] = []
         total_files = len(files)
 
         # Batch processing configuration
@@ -121,6 +164,51 @@ class ModScanner:
 
         return mods
 
+    def _scan_files_parallel(
+        self,
+        files: list[Path],
+        progress_callback: Optional["Callable[[int, int, str], None]"],
+    ) -> list[Mod]:
+        """
+        Scan files across worker processes, keeping results in file order.
+
+        Args:
+            files: Mod files to scan
+            progress_callback: Optional callback (current, total, filename)
+
+        Returns:
+            List of discovered mods
+        """
+        mods: list[Mod] = []
+        total_files = len(files)
+        # Workers get a copy of this scanner's settings, not its running totals
+        worker_scanner = ModScanner(
+            parse_tunings=self.parse_tunings,
+            parse_scripts=self.parse_scripts,
+            parse_string_tables=self.parse_string_tables,
+            parse_sim_data=self.parse_sim_data,
+            calculate_hashes=self.calculate_hashes,
+            script_cache_dir=self.script_cache_dir,
+        )
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            results = executor.map(
+                _scan_file_in_worker,
+                [worker_scanner] * total_files,
+                files,
+                chunksize=8,
+            )
+            for i, (file_path, (mod, errors)) in enumerate(zip(files, results), 1):
+                if progress_callback:
+                    progress_callback(i, total_files, file_path.name)
+
+                self.errors_encountered.extend(errors)
+                if mod:
+                    mods.append(mod)
+                    self.mods_scanned += 1
+
+        return mods
+
     def scan_file(self, file_path: Path) -> Optional[Mod]:
         """
         Scan a single mod file.
@@ -155,13 +243,13 @@ class ModScanner:
             List of file paths
         """
         files: list[Path] = []
+        # One walk for all extensions, matched case-insensitively like scan_file
+        suffixes = tuple(ext.lower() for ext in extensions)
 
-        if recursive:
-            for ext in extensions:
-                files.extend(directory.rglob(f"*{ext}"))
-        else:
-            for ext in extensions:
-                files.extend(directory.glob(f"*{ext}"))
+        for root, _dirs, names in os.walk(directory):
+            files.extend(Path(root, name) for name in names if name.lower().endswith(suffixes))
+            if not recursive:
+                break
 
         return sorted(files)
 
@@ -176,30 +264,29 @@ class ModScanner:
             Mod object or None
         """
         try:
-            # Read DBPF package
-            reader = DBPFReader(file_path)
-
-            # Get basic info
-            size = file_path.stat().st_size
-            file_hash = self._calculate_hash(file_path) if self.calculate_hashes else None
-
-            # Get resources
-            resources = reader.resources
-
-            # Parse tunings if enabled
-            tunings = []
-            if self.parse_tunings:
-                tunings = self._extract_tunings(reader)
-
-            # Parse STBL string tables if enabled
-            string_tables = []
-            if self.parse_string_tables:
-                string_tables = self._extract_string_tables(reader)
-
-            # Parse SimData metadata if enabled
-            sim_data = []
-            if self.parse_sim_data:
-                sim_data = self._extract_sim_data(reader)
+            # Map the package once; every resource read below is served from it
+            with DBPFReader(file_path) as reader:
+                # Get basic info; the header already carries the file size
+                size = reader.header.file_size
+                file_hash = self._calculate_hash(file_path) if self.calculate_hashes else None
+
+                # Get resources
+                resources = tuple(reader.resources)
+
+                # Parse tunings if enabled
+                tunings = []
+                if self.parse_tunings:
+                    tunings = self._extract_tunings(reader)
+
+                # Parse STBL string tables if enabled
+                string_tables = []
+                if self.parse_string_tables:
+                    string_tables = self._extract_string_tables(reader)
+
+                # Parse SimData metadata if enabled
+                sim_data = []
+                if self.parse_sim_data:
+                    sim_data = self._extract_sim_data(reader)
 
             # Detect pack requirements from tunings
             pack_requirements: set[str] = set()
@@ -232,7 +319,7 @@ class ModScanner:
                 type=ModType.PACKAGE,
                 size=file_path.stat().st_size,
                 hash=None,
-                resources=[],
+                resources=(),
                 tunings=[],
                 scripts=[],
             )
@@ -249,35 +336,28 @@ class ModScanner:
         """
         try:
             # Analyze script
-            analyzer = ScriptAnalyzer(file_path)
-
             # Get basic info
             size = file_path.stat().st_size
             file_hash = self._calculate_hash(file_path) if self.calculate_hashes else None
 
-            # Get metadata
-            metadata = analyzer.metadata
-
-            # Analyze modules if enabled
             scripts = []
             requires = []
-            if self.parse_scripts:
-                module_paths = analyzer.module_paths
-                for module_path in module_paths:
-                    try:
-                        script_module = analyzer.analyze_module(module_path)
+            # Metadata and modules share one archive handle, closed on exit
+            with ScriptAnalyzer(file_path, cache_dir=self.script_cache_dir) as analyzer:
+                # Get metadata
+                metadata = analyzer.metadata
+
+                # Analyze modules if enabled
+                if self.parse_scripts:
+                    # One archive pass; modules that fail to parse are skipped
+                    for script_module in analyzer.modules:
                         scripts.append(script_module)
 
                         # Collect requirements
-                        if hasattr(script_module, "imports"):
-                            for imp in script_module.imports:
-                                # Look for common dependency patterns
-                                if "sims4communitylib" in imp.lower():
-                                    requires.append("Sims4CommunityLibrary")
-
-                    except Exception:  # nosec B110 - skip modules that fail to parse
-                        # Skip modules that fail to parse
-                        pass
+                        for imp in script_module.imports:
+                            # Look for common dependency patterns
+                            if "sims4communitylib" in imp.lower():
+                                requires.append("Sims4CommunityLibrary")
 
             # Create mod
             mod = Mod(
@@ -286,7 +366,7 @@ class ModScanner:
                 type=ModType.SCRIPT,
                 size=size,
                 hash=file_hash,
-                resources=[],
+                resources=(),
                 tunings=[],
                 scripts=scripts,
                 version=metadata.version,
@@ -305,7 +385,7 @@ class ModScanner:
                 type=ModType.SCRIPT,
                 size=file_path.stat().st_size,
                 hash=None,
-                resources=[],
+                resources=(),
                 tunings=[],
                 scripts=[],
             )
@@ -321,7 +401,7 @@ class ModScanner:
             List of TuningData objects
         """
         tunings = []
-        parser = TuningParser()
+        parser = self.tuning_parser
 
         for resource in reader.resources:
             if is_tuning_type(resource.type):
@@ -407,11 +487,14 @@ class ModScanner:
         Returns:
             Hexadecimal hash string
         """
-        sha256 = hashlib.sha256()
+        with open(file_path, "rb", buffering=0) as f:
+            # Python 3.11+ hashes the file in C without a Python-level loop
+            if sys.version_info >= (3, 11):
+                return hashlib.file_digest(f, "sha256").hexdigest()
 
-        with open(file_path, "rb") as f:
+            sha256 = hashlib.sha256()
             # Read in chunks for memory efficiency
-            while chunk := f.read(8192):
+            while chunk := f.read(_HASH_CHUNK_SIZE):
                 sha256.update(chunk)
 
         return sha256.hexdigest()
@@ -428,3 +511,24 @@ class ModScanner:
             "errors_encountered": len(self.errors_encountered),
             "error_details": [(str(path), msg) for path, msg in self.errors_encountered],
         }
+
+
+def _scan_file_in_worker(
+    scanner: ModScanner, file_path: Path
+) -> tuple[Optional[Mod], list[tuple[Path, str]]]:
+    """
+    Scan one file in a worker process.
+
+    Args:
+        scanner: Scanner carrying the parse settings
+        file_path: Path to mod file
+
+    Returns:
+        Tuple of (mod or None, errors recorded while scanning the file)
+    """
+    scanner.errors_encountered = []
+    try:
+        mod = scanner.scan_file(file_path)
+    except Exception as e:
+        return None, [(file_path, str(e))]
+    return mod, scanner.errors_encountered
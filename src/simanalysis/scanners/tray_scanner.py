@@ -1,12 +1,17 @@
 """Scanner for discovering Sims 4 tray files (Households, Lots, Rooms)."""
 
+import bisect
+import re
 import struct
 from collections.abc import Callable
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
 
 from simanalysis.exceptions import SimanalysisError
 
+# A run of UTF-16LE code units whose high byte is zero (Latin-1 range)
+_UTF16_LE_RUN = re.compile(rb"(?:[\x01-\xff]\x00)+")
+
 
 class TrayItem:
     """Represents a Sims 4 Tray Item (Household, Lot, Room)."""
@@ -46,6 +51,24 @@ class TrayScanner:
     Groups related files (trayitem, blueprint, bpi, etc.) into logical items.
     """
 
+    # Associated-file suffixes that identify the item type, checked in this order
+    SUFFIX_TYPES: ClassVar[dict[str, str]] = {
+        # Household items have .hhi (Household Info) files
+        ".hhi": "Household",
+        # Lots and Rooms have .blueprint files; rooms are usually smaller and may have
+        # different indicators, so for now these are called Lots (most common)
+        ".blueprint": "Lot",
+        # Room-specific indicator
+        ".rmi": "Room",
+    }
+
+    # Common type codes in the tray item header (may need adjustment)
+    TYPE_CODE_NAMES: ClassVar[dict[int, str]] = {
+        0x00000001: "Household",
+        0x00000002: "Lot",
+        0x00000003: "Room",
+    }
+
     def __init__(self) -> None:
         self.items_scanned = 0
         self.errors_encountered: list[tuple[Path, str]] = []
@@ -73,7 +96,11 @@ class TrayScanner:
         self.items_scanned = 0
         self.errors_encountered = []
 
-        tray_item_files = list(directory.glob("*.trayitem"))
+        # List the folder once; globbing it per item made large Tray folders quadratic
+        siblings = sorted(directory.iterdir(), key=lambda p: p.name)
+        sibling_names = [p.name for p in siblings]
+
+        tray_item_files = [p for p in siblings if p.suffix.lower() == ".trayitem"]
         total_files = len(tray_item_files)
 
         items: list[TrayItem] = []
@@ -83,7 +110,8 @@ class TrayScanner:
                 progress_callback(i, total_files, tray_file.name)
 
             try:
-                item = self._parse_tray_item(tray_file, directory)
+                associated_files = self._files_with_prefix(siblings, sibling_names, tray_file.stem)
+                item = self._parse_tray_item(tray_file, associated_files)
                 if item:
                     items.append(item)
                     self.items_scanned += 1
@@ -92,9 +120,9 @@ class TrayScanner:
 
         return items
 
-    def _parse_tray_item(self, tray_file: Path, directory: Path) -> Optional[TrayItem]:
+    def _parse_tray_item(self, tray_file: Path, associated_files: list[Path]) -> Optional[TrayItem]:
         """
-        Parse a .trayitem file and find associated files.
+        Parse a .trayitem file together with its associated files (same base name).
         """
         try:
             with open(tray_file, "rb") as f:
@@ -103,10 +131,6 @@ class TrayScanner:
             # Extract name from binary content
             name = self._extract_name(content, tray_file.stem)
 
-            # Find all associated files (same base name)
-            base_name = tray_file.stem
-            associated_files = list(directory.glob(f"{base_name}*"))
-
             # Determine type based on associated files and content
             item_type = self._determine_type(associated_files, content)
 
@@ -127,39 +151,18 @@ class TrayScanner:
         Tray items contain UTF-16 encoded strings. We'll search for readable text.
         """
         try:
-            # Try to find UTF-16 encoded strings (Sims 4 uses UTF-16LE)
-            # Look for sequences that might be names
             decoded_parts = []
-
-            # Search for null-terminated UTF-16 strings
-            i = 0
-            while i < len(content) - 1:
-                # Check if we have a potential UTF-16 character
-                if content[i] != 0 and content[i + 1] == 0:
-                    # Start of potential UTF-16 string
-                    string_bytes = bytearray()
-                    j = i
-                    while j < len(content) - 1:
-                        if content[j] == 0 and content[j + 1] == 0:
-                            # Null terminator
-                            break
-                        if content[j + 1] == 0:
-                            string_bytes.append(content[j])
-                            j += 2
-                        else:
-                            break
-
-                    if len(string_bytes) > 2:  # Only consider strings > 2 chars
-                        try:
-                            text = string_bytes.decode("utf-8", errors="ignore")
-                            # Filter out binary junk, keep only printable strings
-                            if text.isprintable() and len(text.strip()) >= 3:
-                                decoded_parts.append(text.strip())
-                        except (UnicodeDecodeError, ValueError):
-                            pass  # Binary data that can't be decoded as text
-                    i = j + 2
-                else:
-                    i += 1
+            pos = 0
+            while (match := _UTF16_LE_RUN.search(content, pos)) is not None:
+                # Keep the low byte of each code unit; only strings > 2 chars count
+                run = match.group()[::2]
+                if len(run) > 2:
+                    text = run.decode("utf-8", errors="ignore")
+                    # Filter out binary junk, keep only printable strings
+                    if text.isprintable() and len(text.strip()) >= 3:
+                        decoded_parts.append(text.strip())
+                # Skip the code unit that ended the run (terminator or wide char)
+                pos = match.end() + 2
 
             # Return the longest reasonable string found (likely the name)
             if decoded_parts:
@@ -175,38 +178,37 @@ class TrayScanner:
         except Exception:
             return fallback
 
+    @staticmethod
+    def _files_with_prefix(siblings: list[Path], names: list[str], prefix: str) -> list[Path]:
+        """Return the ``siblings`` whose names start with ``prefix``.
+
+        ``names`` holds the sibling file names in sorted order, parallel to ``siblings``.
+        """
+        start = bisect.bisect_left(names, prefix)
+        end = start
+        while end < len(names) and names[end].startswith(prefix):
+            end += 1
+        return siblings[start:end]
+
     def _determine_type(self, associated_files: list[Path], content: bytes) -> str:
         """
         Determine the type of tray item based on associated files.
         """
         exts = {f.suffix.lower() for f in associated_files}
 
-        # Household items have .hhi (Household Info) files
-        if ".hhi" in exts:
-            return "Household"
-
-        # Lots and Rooms have .blueprint files
-        if ".blueprint" in exts:
-            # Try to determine if it's a lot or room
-            # Rooms are usually smaller and may have different indicators
-            # For now, we'll call them Lots (most common)
-            return "Lot"
-
-        # Check for room-specific indicators
-        if ".rmi" in exts:
-            return "Room"
+        for suffix, item_type in self.SUFFIX_TYPES.items():
+            if suffix in exts:
+                return item_type
 
         # Fallback: check file type code in tray item header
         # The first few bytes often contain type info
         if len(content) > 4:
             try:
                 # Read potential type marker (varies by game version)
-                type_code = struct.unpack("<I", content[0:4])[0]
+                type_code = struct.unpack_from("<I", content)[0]
 
-                # Common type codes (may need adjustment)
-                type_code_names = {0x00000001: "Household", 0x00000002: "Lot", 0x00000003: "Room"}
-                if type_code in type_code_names:
-                    return type_code_names[type_code]
+                if type_code in self.TYPE_CODE_NAMES:
+                    return self.TYPE_CODE_NAMES[type_code]
             except struct.error:
                 pass  # Invalid binary data format
 
@@ -342,6 +342,8 @@ class SimanalysisTUI:
         calculate_hashes: bool = True,
         recursive: bool = True,
         show_mods: bool = False,
+        workers: int | None = None,
+        script_cache_dir: Path | None = None,
     ) -> AnalysisResult:
         """
         Run analysis with live progress display.
@@ -353,6 +355,8 @@ class SimanalysisTUI:
             calculate_hashes: Whether to calculate file hashes
             recursive: Whether to scan recursively
             show_mods: Whether to show detailed mod list at end
+            workers: Number of worker processes used to scan files
+            script_cache_dir: Directory for cached script analysis results
 
         Returns:
             Analysis result
@@ -362,6 +366,8 @@ class SimanalysisTUI:
             parse_tunings=parse_tunings,
             parse_scripts=parse_scripts,
             calculate_hashes=calculate_hashes,
+            workers=workers,
+            script_cache_dir=script_cache_dir,
         )
 
         # Create progress display
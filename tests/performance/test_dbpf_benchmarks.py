@@ -4,6 +4,7 @@ These tests measure parsing performance for different file sizes
 to ensure the parser scales efficiently.
 
 Run with: pytest tests/performance/test_dbpf_benchmarks.py -v
+Skip the large-package benchmarks with: pytest -m "not slow"
 """
 
 import struct
@@ -19,8 +20,9 @@ from simanalysis.parsers.dbpf import DBPFReader
 pytestmark = pytest.mark.synthetic
 
 
+@pytest.mark.slow
 class TestDBPFPerformance:
-    """Performance benchmarks for DBPF parser."""
+    """Performance benchmarks for DBPF parser (fixtures write packages up to 100MB)."""
 
     @pytest.fixture
     def benchmark_1mb_package(self, tmp_path: Path) -> Path:
@@ -0,0 +1,67 @@
+"""Performance benchmarks for conflict detectors.
+
+These tests time detection over a synthetic mod set large enough that an
+accidental quadratic pass would blow past the ceilings.
+
+Run with: pytest tests/performance/test_detector_benchmarks.py -v
+Skip them with: pytest -m "not slow"
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from simanalysis.detectors.tuning_conflicts import TuningConflictDetector
+from simanalysis.models import Mod, ModType, TuningData
+
+pytestmark = pytest.mark.synthetic
+
+
+@pytest.mark.slow
+class TestTuningDetectorPerformance:
+    """Performance benchmarks for TuningConflictDetector (timed, so kept out of parallel runs)."""
+
+    @pytest.fixture(scope="class")
+    def overlapping_mods(self) -> list[Mod]:
+        """Create 500 mods x 20 tunings where each tuning ID is shared by 5 mods."""
+        mod_count = 500
+        tunings_per_mod = 20
+        return [
+            Mod(
+                name=f"mod{i}.package",
+                path=Path(f"/mods/mod{i}.package"),
+                type=ModType.PACKAGE,
+                size=1000,
+                hash=f"hash{i}",
+                tunings=[
+                    TuningData(
+                        instance_id=(i // 5) * tunings_per_mod + j,
+                        tuning_name=f"tuning_{j}",
+                        tuning_class="Buff" if j % 2 else "Object",
+                        module="buffs",
+                    )
+                    for j in range(tunings_per_mod)
+                ],
+            )
+            for i in range(mod_count)
+        ]
+
+    @pytest.mark.benchmark
+    def test_detect_overlapping_tunings(self, overlapping_mods: list[Mod]) -> None:
+        """Benchmark: Detect tuning conflicts across 10,000 tunings."""
+        detector = TuningConflictDetector()
+        iterations = 5
+        times = []
+
+        for _ in range(iterations):
+            start = time.perf_counter()
+            conflicts = detector.detect(overlapping_mods)
+            elapsed = time.perf_counter() - start
+            times.append(elapsed)
+
+        avg_time = sum(times) / len(times)
+
+        # 100 groups of 5 mods x 20 shared tuning IDs
+        assert len(conflicts) == 2000
+        assert avg_time < 0.5  # Should be < 500ms
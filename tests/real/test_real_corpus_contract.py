@@ -199,9 +199,9 @@ def test_real_ts4script_fixture_matches_golden() -> None:
             pytest.fail(f"Golden sidecar is missing for {item['id']}: {golden_path}")
         golden = json.loads(golden_path.read_text(encoding="utf-8"))
 
-        analyzer = ScriptAnalyzer(script_path)
-        metadata = analyzer.metadata
-        modules = analyzer.list_modules()
+        with ScriptAnalyzer(script_path) as analyzer:
+            metadata = analyzer.metadata
+            modules = analyzer.list_modules()
         mod = ModScanner(parse_scripts=True, calculate_hashes=False).scan_file(script_path)
 
         assert {
@@ -1,9 +1,12 @@
 """Tests for mod analyzer."""
 
+import dataclasses
+import io
 import json
 import struct
 import zlib
 from pathlib import Path
+from typing import Optional
 
 import pytest
 
@@ -11,6 +14,7 @@ from simanalysis.analyzers import ModAnalyzer
 from simanalysis.detectors.base import ConflictDetector
 from simanalysis.detectors.script_conflicts import ScriptConflictDetector
 from simanalysis.models import (
+    AnalysisResult,
     ConflictType,
     DBPFResource,
     Mod,
@@ -19,20 +23,37 @@ from simanalysis.models import (
     TuningData,
 )
 
+_MODS = Path("/mods")
+_MOD1_PATH = _MODS / "mod1.package"
+_MOD2_PATH = _MODS / "mod2.package"
+
+
+def _mk_mod(
+    i: int, *, tunings: Optional[list[TuningData]] = None, hash_: Optional[str] = None
+) -> Mod:
+    """Build the ``mod{i}.package`` fixture mod used by the recommendation tests."""
+    return Mod(
+        f"mod{i}.package",
+        _MODS / f"mod{i}.package",
+        ModType.PACKAGE,
+        1000,
+        hash_ or f"hash{i}",
+        tunings=tunings or [],
+    )
+
 
 class TestModAnalyzer:
     """Tests for ModAnalyzer."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def analyzer(self) -> ModAnalyzer:
-        """Create analyzer instance."""
+        """Create analyzer instance shared across the module (analysis is stateless)."""
         return ModAnalyzer()
 
-    @pytest.fixture
-    def test_mods_directory(self, tmp_path: Path) -> Path:
-        """Create test directory with sample mods."""
-        mods_dir = tmp_path / "Mods"
-        mods_dir.mkdir()
+    @pytest.fixture(scope="module")
+    def test_mods_directory(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Create test directory with sample mods (built once per module)."""
+        mods_dir = tmp_path_factory.mktemp("Mods")
 
         # Create two package files with conflicting tunings
         for _i, name in enumerate(["mod_a.package", "mod_b.package"]):
@@ -42,13 +63,25 @@ class TestModAnalyzer:
         return mods_dir
 
     @pytest.fixture
+    def mods_directory_with_subfolder(self, tmp_path: Path) -> Path:
+        """Create an isolated mods directory with a package nested in a subfolder."""
+        mods_dir = tmp_path / "Mods"
+        subfolder = mods_dir / "Subfolder"
+        subfolder.mkdir(parents=True)
+
+        self._create_test_package(mods_dir / "root_mod.package")
+        self._create_test_package(subfolder / "nested_mod.package")
+
+        return mods_dir
+
+    @pytest.fixture(scope="module")
     def test_mods_with_conflicts(self) -> list[Mod]:
         """Create test mods with conflicts."""
         shared_tuning_id = 0xAABBCCDD
 
         mod1 = Mod(
             name="mod1.package",
-            path=Path("/mods/mod1.package"),
+            path=_MOD1_PATH,
             type=ModType.PACKAGE,
             size=1000,
             hash="hash1",
@@ -64,7 +97,7 @@ class TestModAnalyzer:
 
         mod2 = Mod(
             name="mod2.package",
-            path=Path("/mods/mod2.package"),
+            path=_MOD2_PATH,
             type=ModType.PACKAGE,
             size=2000,
             hash="hash2",
@@ -80,12 +113,28 @@ class TestModAnalyzer:
 
         return [mod1, mod2]
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def conflicts_result(
+        self, analyzer: ModAnalyzer, test_mods_with_conflicts: list[Mod]
+    ) -> AnalysisResult:
+        """Analyze the conflicting mods once per module (tests must not mutate it)."""
+        return analyzer.analyze_mods(test_mods_with_conflicts)
+
+    @pytest.fixture(scope="module")
+    def text_report_content(self, analyzer: ModAnalyzer, conflicts_result: AnalysisResult) -> str:
+        """Export the text report for the conflicting mods once per module."""
+        buffer = io.StringIO()
+
+        analyzer.export_report(conflicts_result, buffer, format="txt")
+
+        return buffer.getvalue()
+
+    @pytest.fixture(scope="module")
     def test_mods_no_conflicts(self) -> list[Mod]:
         """Create test mods without conflicts."""
         mod1 = Mod(
             name="mod1.package",
-            path=Path("/mods/mod1.package"),
+            path=_MOD1_PATH,
             type=ModType.PACKAGE,
             size=1000,
             hash="hash1",
@@ -101,7 +150,7 @@ class TestModAnalyzer:
 
         mod2 = Mod(
             name="mod2.package",
-            path=Path("/mods/mod2.package"),
+            path=_MOD2_PATH,
             type=ModType.PACKAGE,
             size=2000,
             hash="hash2",
@@ -117,6 +166,13 @@ class TestModAnalyzer:
 
         return [mod1, mod2]
 
+    @pytest.fixture(scope="module")
+    def no_conflicts_result(
+        self, analyzer: ModAnalyzer, test_mods_no_conflicts: list[Mod]
+    ) -> AnalysisResult:
+        """Analyze the non-conflicting mods once per module (tests must not mutate it)."""
+        return analyzer.analyze_mods(test_mods_no_conflicts)
+
     def _create_test_package(self, path: Path, tuning_id: int = 0x12345678) -> None:
         """Create a minimal test package file."""
         # Create minimal DBPF file (96-byte header)
@@ -161,11 +217,13 @@ class TestModAnalyzer:
             parse_tunings=False,
             parse_scripts=False,
             calculate_hashes=False,
+            workers=2,
         )
 
         assert analyzer.scanner.parse_tunings is False
         assert analyzer.scanner.parse_scripts is False
         assert analyzer.scanner.calculate_hashes is False
+        assert analyzer.scanner.workers == 2
 
     def test_analyzer_custom_detectors(self) -> None:
         """Test analyzer with custom detectors."""
@@ -180,31 +238,23 @@ class TestModAnalyzer:
         assert len(analyzer.detectors) == 1
         assert isinstance(analyzer.detectors[0], CustomDetector)
 
-    def test_analyze_mods_with_conflicts(
-        self, analyzer: ModAnalyzer, test_mods_with_conflicts: list[Mod]
-    ) -> None:
+    def test_analyze_mods_with_conflicts(self, conflicts_result: AnalysisResult) -> None:
         """Test analyzing mods with conflicts."""
-        result = analyzer.analyze_mods(test_mods_with_conflicts)
-
-        assert len(result.mods) == 2
-        assert len(result.conflicts) > 0
-        assert any(c.type == ConflictType.TUNING_OVERLAP for c in result.conflicts)
+        assert len(conflicts_result.mods) == 2
+        assert len(conflicts_result.conflicts) > 0
+        assert any(c.type == ConflictType.TUNING_OVERLAP for c in conflicts_result.conflicts)
 
-    def test_analyze_mods_no_conflicts(
-        self, analyzer: ModAnalyzer, test_mods_no_conflicts: list[Mod]
-    ) -> None:
+    def test_analyze_mods_no_conflicts(self, no_conflicts_result: AnalysisResult) -> None:
         """Test analyzing mods without conflicts."""
-        result = analyzer.analyze_mods(test_mods_no_conflicts)
-
-        assert len(result.mods) == 2
-        assert len(result.conflicts) == 0
+        assert len(no_conflicts_result.mods) == 2
+        assert len(no_conflicts_result.conflicts) == 0
 
     def test_analyze_mods_detects_script_family_conflict(self, analyzer: ModAnalyzer) -> None:
         """Test default analyzer detects script-family namespace collisions."""
         mods = [
             Mod(
                 name="alpha.ts4script",
-                path=Path("/mods/alpha.ts4script"),
+                path=_MODS / "alpha.ts4script",
                 type=ModType.SCRIPT,
                 size=1000,
                 hash="hash-alpha",
@@ -212,7 +262,7 @@ class TestModAnalyzer:
             ),
             Mod(
                 name="beta.ts4script",
-                path=Path("/mods/beta.ts4script"),
+                path=_MODS / "beta.ts4script",
                 type=ModType.SCRIPT,
                 size=1000,
                 hash="hash-beta",
@@ -240,10 +290,9 @@ class TestModAnalyzer:
         assert all(hasattr(c, "type") for c in conflicts)
         assert all(hasattr(c, "severity") for c in conflicts)
 
-    def test_get_summary(self, analyzer: ModAnalyzer, test_mods_with_conflicts: list[Mod]) -> None:
+    def test_get_summary(self, analyzer: ModAnalyzer, conflicts_result: AnalysisResult) -> None:
         """Test getting summary statistics."""
-        result = analyzer.analyze_mods(test_mods_with_conflicts)
-        summary = analyzer.get_summary(result)
+        summary = analyzer.get_summary(conflicts_result)
 
         assert "total_mods" in summary
         assert "total_conflicts" in summary
@@ -257,79 +306,52 @@ class TestModAnalyzer:
         assert summary["total_conflicts"] > 0
 
     def test_get_recommendations_with_conflicts(
-        self, analyzer: ModAnalyzer, test_mods_with_conflicts: list[Mod]
+        self, analyzer: ModAnalyzer, conflicts_result: AnalysisResult
     ) -> None:
         """Test getting recommendations with conflicts."""
-        result = analyzer.analyze_mods(test_mods_with_conflicts)
-        recommendations = analyzer.get_recommendations(result)
+        recommendations = analyzer.get_recommendations(conflicts_result)
 
         assert len(recommendations) > 0
-        assert any("conflict" in rec.lower() for rec in recommendations)
+        assert "conflict" in "\n".join(recommendations).lower()
 
     def test_get_recommendations_no_conflicts(
-        self, analyzer: ModAnalyzer, test_mods_no_conflicts: list[Mod]
+        self, analyzer: ModAnalyzer, no_conflicts_result: AnalysisResult
     ) -> None:
         """Test getting recommendations without conflicts."""
-        result = analyzer.analyze_mods(test_mods_no_conflicts)
-        recommendations = analyzer.get_recommendations(result)
+        recommendations = analyzer.get_recommendations(no_conflicts_result)
 
         assert len(recommendations) > 0
-        assert any("no conflicts" in rec.lower() for rec in recommendations)
+        assert "no conflicts" in "\n".join(recommendations).lower()
 
     def test_get_recommendations_many_mods(self, analyzer: ModAnalyzer) -> None:
         """Test recommendations for many mods."""
         # Create 150 mods
-        mods = [
-            Mod(
-                name=f"mod{i}.package",
-                path=Path(f"/mods/mod{i}.package"),
-                type=ModType.PACKAGE,
-                size=1000,
-                hash=f"hash{i}",
-            )
-            for i in range(150)
-        ]
+        mods = [_mk_mod(i) for i in range(150)]
 
         result = analyzer.analyze_mods(mods)
         recommendations = analyzer.get_recommendations(result)
 
         # Should mention organizing into subfolders
-        assert any(
-            "organizing" in rec.lower() or "subfolders" in rec.lower() for rec in recommendations
-        )
+        joined = "\n".join(recommendations).lower()
+        assert "organizing" in joined or "subfolders" in joined
 
-    def test_export_text_report(
-        self, analyzer: ModAnalyzer, test_mods_with_conflicts: list[Mod], tmp_path: Path
-    ) -> None:
+    def test_export_text_report(self, text_report_content: str) -> None:
         """Test exporting text report."""
-        result = analyzer.analyze_mods(test_mods_with_conflicts)
-        output_path = tmp_path / "report.txt"
-
-        analyzer.export_report(result, output_path, format="txt")
-
-        assert output_path.exists()
-        content = output_path.read_text(encoding="utf-8")
-
-        assert "MOD ANALYSIS REPORT" in content
-        assert "SUMMARY" in content
-        assert "Total Mods" in content
-        assert "Total Conflicts" in content
+        assert "MOD ANALYSIS REPORT" in text_report_content
+        assert "SUMMARY" in text_report_content
+        assert "Total Mods" in text_report_content
+        assert "Total Conflicts" in text_report_content
 
     def test_export_json_report(
-        self, analyzer: ModAnalyzer, test_mods_with_conflicts: list[Mod], tmp_path: Path
+        self, analyzer: ModAnalyzer, conflicts_result: AnalysisResult
     ) -> None:
         """Test exporting JSON report."""
-        result = analyzer.analyze_mods(test_mods_with_conflicts)
-        result.warnings.append("load-order confidence warning")
-        output_path = tmp_path / "report.json"
-
-        analyzer.export_report(result, output_path, format="json")
+        result = dataclasses.replace(conflicts_result, warnings=["load-order confidence warning"])
+        buffer = io.StringIO()
 
-        assert output_path.exists()
+        analyzer.export_report(result, buffer, format="json")
 
-        # Parse JSON
-        with open(output_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(buffer.getvalue())
 
         assert "summary" in data
         assert "recommendations" in data
@@ -340,15 +362,24 @@ class TestModAnalyzer:
         assert "resource_summary" in data["mods"][0]
         assert "details" in data["conflicts"][0]
 
+    def test_export_report_to_str_path(
+        self, analyzer: ModAnalyzer, conflicts_result: AnalysisResult, tmp_path: Path
+    ) -> None:
+        """Test a plain string path is written like a Path."""
+        output_path = tmp_path / "report.txt"
+
+        analyzer.export_report(conflicts_result, str(output_path), format="txt")
+
+        assert "MOD ANALYSIS REPORT" in output_path.read_text(encoding="utf-8")
+
     def test_export_unsupported_format(
-        self, analyzer: ModAnalyzer, test_mods_with_conflicts: list[Mod], tmp_path: Path
+        self, analyzer: ModAnalyzer, conflicts_result: AnalysisResult, tmp_path: Path
     ) -> None:
         """Test exporting with unsupported format."""
-        result = analyzer.analyze_mods(test_mods_with_conflicts)
         output_path = tmp_path / "report.xml"
 
         with pytest.raises(ValueError, match="Unsupported format"):
-            analyzer.export_report(result, output_path, format="xml")
+            analyzer.export_report(conflicts_result, output_path, format="xml")
 
     def test_analyze_directory(self, analyzer: ModAnalyzer, test_mods_directory: Path) -> None:
         """Test analyzing a directory."""
@@ -389,7 +420,7 @@ class TestModAnalyzer:
                 type=ModType.PACKAGE,
                 size=1000,
                 hash="base_hash",
-                resources=[shared_resource],
+                resources=(shared_resource,),
             ),
             Mod(
                 name="winner.package",
@@ -397,7 +428,7 @@ class TestModAnalyzer:
                 type=ModType.PACKAGE,
                 size=1000,
                 hash="winner_hash",
-                resources=[shared_resource],
+                resources=(shared_resource,),
             ),
         ]
         analyzer = ModAnalyzer(parse_tunings=False, calculate_hashes=False)
@@ -414,30 +445,22 @@ class TestModAnalyzer:
         assert result.warnings == []
 
     def test_analyze_directory_non_recursive(
-        self, analyzer: ModAnalyzer, test_mods_directory: Path
+        self, analyzer: ModAnalyzer, mods_directory_with_subfolder: Path
     ) -> None:
         """Test non-recursive directory analysis."""
-        # Create subfolder with mods
-        subfolder = test_mods_directory / "Subfolder"
-        subfolder.mkdir()
-        self._create_test_package(subfolder / "nested_mod.package")
-
         # Non-recursive should not find nested mod
-        result = analyzer.analyze_directory(test_mods_directory, recursive=False)
+        result = analyzer.analyze_directory(mods_directory_with_subfolder, recursive=False)
 
         # Should only find mods in root directory
+        assert [mod.name for mod in result.mods] == ["root_mod.package"]
         assert all("Subfolder" not in str(mod.path) for mod in result.mods)
 
     def test_recommendations_critical_conflicts(self, analyzer: ModAnalyzer) -> None:
         """Test recommendations with critical conflicts."""
         # Create mods with critical conflict (Buff is core)
         mods = [
-            Mod(
-                name=f"mod{i}.package",
-                path=Path(f"/mods/mod{i}.package"),
-                type=ModType.PACKAGE,
-                size=1000,
-                hash=f"hash{i}",
+            _mk_mod(
+                i,
                 tunings=[
                     TuningData(
                         instance_id=0x99999999,
@@ -454,67 +477,40 @@ class TestModAnalyzer:
         recommendations = analyzer.get_recommendations(result)
 
         # Should mention critical conflicts
-        assert any("critical" in rec.lower() for rec in recommendations)
+        assert "critical" in "\n".join(recommendations).lower()
 
     def test_recommendations_hash_collisions(self, analyzer: ModAnalyzer) -> None:
         """Test recommendations with hash collisions."""
         # Create mods with same hash
         duplicate_hash = "duplicate_hash_12345"
-        mods = [
-            Mod(
-                name=f"mod{i}.package",
-                path=Path(f"/mods/mod{i}.package"),
-                type=ModType.PACKAGE,
-                size=1000,
-                hash=duplicate_hash,
-            )
-            for i in range(2)
-        ]
+        mods = [_mk_mod(i, hash_=duplicate_hash) for i in range(2)]
 
         result = analyzer.analyze_mods(mods)
         recommendations = analyzer.get_recommendations(result)
 
         # Should mention duplicates
-        assert any("duplicate" in rec.lower() for rec in recommendations)
+        assert "duplicate" in "\n".join(recommendations).lower()
 
-    def test_text_report_includes_recommendations(
-        self, analyzer: ModAnalyzer, test_mods_with_conflicts: list[Mod], tmp_path: Path
-    ) -> None:
+    def test_text_report_includes_recommendations(self, text_report_content: str) -> None:
         """Test that text report includes recommendations."""
-        result = analyzer.analyze_mods(test_mods_with_conflicts)
-        output_path = tmp_path / "report.txt"
-
-        analyzer.export_report(result, output_path, format="txt")
-
-        content = output_path.read_text(encoding="utf-8")
-        assert "RECOMMENDATIONS" in content
+        assert "RECOMMENDATIONS" in text_report_content
 
-    def test_text_report_groups_by_severity(
-        self, analyzer: ModAnalyzer, test_mods_with_conflicts: list[Mod], tmp_path: Path
-    ) -> None:
+    def test_text_report_groups_by_severity(self, text_report_content: str) -> None:
         """Test that text report groups conflicts by severity."""
-        result = analyzer.analyze_mods(test_mods_with_conflicts)
-        output_path = tmp_path / "report.txt"
-
-        analyzer.export_report(result, output_path, format="txt")
-
-        content = output_path.read_text(encoding="utf-8")
         # Should have severity sections
-        assert "CONFLICTS" in content
+        assert "CONFLICTS" in text_report_content
         # Will have at least one severity level mentioned
-        assert any(sev in content for sev in ["CRITICAL", "HIGH", "MEDIUM", "LOW"])
+        assert any(sev in text_report_content for sev in ["CRITICAL", "HIGH", "MEDIUM", "LOW"])
 
     def test_json_report_structure(
-        self, analyzer: ModAnalyzer, test_mods_no_conflicts: list[Mod], tmp_path: Path
+        self, analyzer: ModAnalyzer, no_conflicts_result: AnalysisResult, tmp_path: Path
     ) -> None:
         """Test JSON report has correct structure."""
-        result = analyzer.analyze_mods(test_mods_no_conflicts)
         output_path = tmp_path / "report.json"
 
-        analyzer.export_report(result, output_path, format="json")
+        analyzer.export_report(no_conflicts_result, output_path, format="json")
 
-        with open(output_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(output_path.read_bytes())
 
         # Check mod structure
         assert len(data["mods"]) == 2
@@ -0,0 +1,35 @@
+"""Shared fixtures for conflict detector tests."""
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Callable, Optional
+
+import pytest
+
+from simanalysis.models import DBPFResource, Mod, ModType, TuningData
+
+
+@pytest.fixture(scope="session")
+def make_mod() -> Callable[..., Mod]:
+    """Factory for in-memory ``/mods`` mods shared by every detector test module."""
+
+    def _make_mod(
+        name: str,
+        *,
+        size: int = 1000,
+        hash: Optional[str] = None,
+        resources: Iterable[DBPFResource] = (),
+        tunings: Iterable[TuningData] = (),
+    ) -> Mod:
+        """Build an in-memory package mod under ``/mods``."""
+        return Mod(
+            name=name,
+            path=Path(f"/mods/{name}"),
+            type=ModType.PACKAGE,
+            size=size,
+            hash=hash,
+            resources=tuple(resources),
+            tunings=list(tunings),
+        )
+
+    return _make_mod
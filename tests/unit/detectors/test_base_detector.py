@@ -46,19 +46,19 @@ class TestConflictDetector:
                 )
             return conflicts
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def detector(self):
-        """Create a simple detector."""
+        """Create a simple detector shared by the class (tests never run it)."""
         return self.SimpleDetector()
 
     @pytest.fixture
     def counting_detector(self):
-        """Create a counting detector."""
+        """Create a fresh counting detector (run() mutates its metadata)."""
         return self.CountingDetector()
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_mods(self):
-        """Create sample mods for testing."""
+        """Create sample mods shared by the class (detectors only read them)."""
         return [
             Mod(
                 name="mod_a.package",
@@ -96,63 +96,44 @@ class TestConflictDetector:
 
         assert severity == Severity.CRITICAL
 
-    def test_calculate_severity_script_injection(self, detector):
-        """Test severity calculation for script injections."""
-        # 3+ affected = CRITICAL
-        severity = detector.calculate_severity(ConflictType.SCRIPT_INJECTION, affected_count=3)
-        assert severity == Severity.CRITICAL
+    @pytest.mark.parametrize(
+        ("conflict_type", "affected_count", "expected"),
+        [
+            pytest.param(
+                ConflictType.SCRIPT_INJECTION, 3, Severity.CRITICAL, id="script_injection_3"
+            ),
+            pytest.param(ConflictType.SCRIPT_INJECTION, 2, Severity.HIGH, id="script_injection_2"),
+            pytest.param(
+                ConflictType.SCRIPT_INJECTION, 1, Severity.MEDIUM, id="script_injection_1"
+            ),
+            pytest.param(ConflictType.TUNING_OVERLAP, 3, Severity.HIGH, id="tuning_overlap_3"),
+            pytest.param(ConflictType.TUNING_OVERLAP, 2, Severity.MEDIUM, id="tuning_overlap_2"),
+            pytest.param(ConflictType.TUNING_OVERLAP, 1, Severity.LOW, id="tuning_overlap_1"),
+            pytest.param(
+                ConflictType.RESOURCE_DUPLICATE, 3, Severity.MEDIUM, id="resource_duplicate_3"
+            ),
+            pytest.param(
+                ConflictType.RESOURCE_DUPLICATE, 2, Severity.LOW, id="resource_duplicate_2"
+            ),
+            pytest.param(
+                ConflictType.DEPENDENCY_MISSING, 1, Severity.HIGH, id="dependency_missing_1"
+            ),
+            pytest.param(
+                ConflictType.VERSION_CONFLICT, 2, Severity.MEDIUM, id="version_conflict_2"
+            ),
+            pytest.param(
+                ConflictType.NAMESPACE_COLLISION, 2, Severity.HIGH, id="namespace_collision_2"
+            ),
+            pytest.param(
+                ConflictType.NAMESPACE_COLLISION, 1, Severity.MEDIUM, id="namespace_collision_1"
+            ),
+        ],
+    )
+    def test_calculate_severity_matrix(self, detector, conflict_type, affected_count, expected):
+        """Test severity calculation across conflict types and affected counts."""
+        severity = detector.calculate_severity(conflict_type, affected_count=affected_count)
 
-        # 2 affected = HIGH
-        severity = detector.calculate_severity(ConflictType.SCRIPT_INJECTION, affected_count=2)
-        assert severity == Severity.HIGH
-
-        # 1 affected = MEDIUM
-        severity = detector.calculate_severity(ConflictType.SCRIPT_INJECTION, affected_count=1)
-        assert severity == Severity.MEDIUM
-
-    def test_calculate_severity_tuning_overlap(self, detector):
-        """Test severity calculation for tuning overlaps."""
-        # 3+ affected = HIGH
-        severity = detector.calculate_severity(ConflictType.TUNING_OVERLAP, affected_count=3)
-        assert severity == Severity.HIGH
-
-        # 2 affected = MEDIUM
-        severity = detector.calculate_severity(ConflictType.TUNING_OVERLAP, affected_count=2)
-        assert severity == Severity.MEDIUM
-
-        # 1 affected = LOW
-        severity = detector.calculate_severity(ConflictType.TUNING_OVERLAP, affected_count=1)
-        assert severity == Severity.LOW
-
-    def test_calculate_severity_resource_duplicate(self, detector):
-        """Test severity calculation for resource duplicates."""
-        # 3+ affected = MEDIUM
-        severity = detector.calculate_severity(ConflictType.RESOURCE_DUPLICATE, affected_count=3)
-        assert severity == Severity.MEDIUM
-
-        # <3 affected = LOW
-        severity = detector.calculate_severity(ConflictType.RESOURCE_DUPLICATE, affected_count=2)
-        assert severity == Severity.LOW
-
-    def test_calculate_severity_dependency_missing(self, detector):
-        """Test severity for missing dependencies."""
-        severity = detector.calculate_severity(ConflictType.DEPENDENCY_MISSING, affected_count=1)
-        assert severity == Severity.HIGH
-
-    def test_calculate_severity_version_conflict(self, detector):
-        """Test severity for version conflicts."""
-        severity = detector.calculate_severity(ConflictType.VERSION_CONFLICT, affected_count=2)
-        assert severity == Severity.MEDIUM
-
-    def test_calculate_severity_namespace_collision(self, detector):
-        """Test severity for namespace collisions."""
-        # 2+ affected = HIGH
-        severity = detector.calculate_severity(ConflictType.NAMESPACE_COLLISION, affected_count=2)
-        assert severity == Severity.HIGH
-
-        # 1 affected = MEDIUM
-        severity = detector.calculate_severity(ConflictType.NAMESPACE_COLLISION, affected_count=1)
-        assert severity == Severity.MEDIUM
+        assert severity == expected
 
     def test_generate_conflict_id(self, detector):
         """Test conflict ID generation."""
@@ -162,15 +143,13 @@ class TestConflictDetector:
         assert "12345678" in conflict_id
 
     def test_generate_conflict_id_unique_types(self, detector):
-        """Test that different conflict types get different prefixes."""
-        id1 = detector.generate_conflict_id(ConflictType.TUNING_OVERLAP, "test")
-        id2 = detector.generate_conflict_id(ConflictType.SCRIPT_INJECTION, "test")
-        id3 = detector.generate_conflict_id(ConflictType.RESOURCE_DUPLICATE, "test")
+        """Test that every conflict type gets a distinct prefix."""
+        ids = {
+            conflict_type: detector.generate_conflict_id(conflict_type, "test")
+            for conflict_type in ConflictType
+        }
 
-        # All should be different due to type prefix
-        assert id1 != id2
-        assert id2 != id3
-        assert id1 != id3
+        assert len(set(ids.values())) == len(ids)
 
     def test_create_conflict(self, detector):
         """Test creating a conflict object."""
@@ -244,38 +223,41 @@ class TestSeverityRules:
         """Test medium threshold constant."""
         assert SeverityRules.MEDIUM_THRESHOLD == 1
 
-    def test_is_core_tuning_true(self):
+    @pytest.mark.parametrize(
+        ("tuning_class", "expected"),
+        [
+            ("Buff", True),
+            ("Trait", True),
+            ("Skill", True),
+            ("Career", True),
+            ("Object", False),
+            ("Interaction", False),
+            ("Unknown", False),
+        ],
+    )
+    def test_is_core_tuning(self, tuning_class, expected):
         """Test identifying core tuning types."""
-        assert SeverityRules.is_core_tuning("Buff") is True
-        assert SeverityRules.is_core_tuning("Trait") is True
-        assert SeverityRules.is_core_tuning("Skill") is True
-        assert SeverityRules.is_core_tuning("Career") is True
-
-    def test_is_core_tuning_false(self):
-        """Test non-core tuning types."""
-        assert SeverityRules.is_core_tuning("Object") is False
-        assert SeverityRules.is_core_tuning("Interaction") is False
-        assert SeverityRules.is_core_tuning("Unknown") is False
-
-    def test_is_high_risk_hook_true(self):
+        assert SeverityRules.is_core_tuning(tuning_class) is expected
+
+    @pytest.mark.parametrize(
+        ("hook_name", "expected"),
+        [
+            ("inject_to", True),
+            ("wrap_function", True),
+            ("override", True),
+            ("@inject_to", True),
+            ("listener", False),
+            ("event.register", False),
+        ],
+    )
+    def test_is_high_risk_hook(self, hook_name, expected):
         """Test identifying high-risk hooks."""
-        assert SeverityRules.is_high_risk_hook("inject_to") is True
-        assert SeverityRules.is_high_risk_hook("wrap_function") is True
-        assert SeverityRules.is_high_risk_hook("override") is True
-        assert SeverityRules.is_high_risk_hook("@inject_to") is True
-
-    def test_is_high_risk_hook_false(self):
-        """Test non-high-risk hooks."""
-        assert SeverityRules.is_high_risk_hook("listener") is False
-        assert SeverityRules.is_high_risk_hook("event.register") is False
-
-    def test_core_tuning_types_defined(self):
-        """Test that core tuning types are defined."""
+        assert SeverityRules.is_high_risk_hook(hook_name) is expected
+
+    def test_rule_tables_nonempty(self):
+        """Test that core tuning types and high-risk hooks are defined."""
         assert len(SeverityRules.CORE_TUNING_TYPES) > 0
         assert "Buff" in SeverityRules.CORE_TUNING_TYPES
-
-    def test_high_risk_hooks_defined(self):
-        """Test that high-risk hooks are defined."""
         assert len(SeverityRules.HIGH_RISK_HOOKS) > 0
         assert "inject_to" in SeverityRules.HIGH_RISK_HOOKS
 
@@ -283,28 +265,20 @@ class TestSeverityRules:
 class TestConflictResolutions:
     """Tests for ConflictResolutions class."""
 
-    def test_tuning_overlap_resolution(self):
-        """Test tuning overlap resolution text."""
-        assert len(ConflictResolutions.TUNING_OVERLAP) > 0
-        assert "compatibility" in ConflictResolutions.TUNING_OVERLAP.lower()
-
-    def test_resource_duplicate_resolution(self):
-        """Test resource duplicate resolution text."""
-        assert len(ConflictResolutions.RESOURCE_DUPLICATE) > 0
-        assert "duplicate" in ConflictResolutions.RESOURCE_DUPLICATE.lower()
-
-    def test_script_injection_resolution(self):
-        """Test script injection resolution text."""
-        assert len(ConflictResolutions.SCRIPT_INJECTION) > 0
-        assert "inject" in ConflictResolutions.SCRIPT_INJECTION.lower()
-
-    def test_get_resolution_known_types(self):
-        """Test getting resolution for known conflict types."""
-        resolution = ConflictResolutions.get_resolution(ConflictType.TUNING_OVERLAP)
-        assert resolution == ConflictResolutions.TUNING_OVERLAP
-
-        resolution = ConflictResolutions.get_resolution(ConflictType.RESOURCE_DUPLICATE)
-        assert resolution == ConflictResolutions.RESOURCE_DUPLICATE
+    @pytest.mark.parametrize(
+        ("conflict_type", "expected_text"),
+        [
+            (ConflictType.TUNING_OVERLAP, "compatibility"),
+            (ConflictType.RESOURCE_DUPLICATE, "duplicate"),
+            (ConflictType.SCRIPT_INJECTION, "inject"),
+        ],
+    )
+    def test_resolution_content(self, conflict_type, expected_text):
+        """Test known conflict types resolve to their template text."""
+        resolution = ConflictResolutions.get_resolution(conflict_type)
+
+        assert resolution == getattr(ConflictResolutions, conflict_type.name)
+        assert expected_text in resolution.lower()
 
     def test_get_resolution_all_types(self):
         """Test that all conflict types have resolutions."""
@@ -1,6 +1,7 @@
 """Tests for resource conflict detector."""
 
 from pathlib import Path
+from typing import Callable, Union
 
 import pytest
 
@@ -11,231 +12,198 @@ from simanalysis.models import (
     ConflictType,
     DBPFResource,
     Mod,
+    ModConflict,
     ModType,
     Severity,
 )
 
 
+def _make_resource(resource_type: int, instance: int, size: int = 1000) -> DBPFResource:
+    """Build an uncompressed group-0 resource entry."""
+    return DBPFResource(
+        type=resource_type,
+        group=0x00000000,
+        instance=instance,
+        size=size,
+        offset=0,
+        compressed_size=0,
+    )
+
+
+# Shared read-only resources reused by several fixtures and tests
+_DDS_RESOURCE = _make_resource(int(DDS_IMAGE), 0x12345678)
+_GEOM_RESOURCE = _make_resource(GEOM, 0x22222222, size=2000)
+_SIMDATA_RESOURCE = _make_resource(int(SIMDATA), 0x99999999, size=500)
+
+
 class TestResourceConflictDetector:
     """Tests for ResourceConflictDetector."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def detector(self) -> ResourceConflictDetector:
-        """Create detector instance."""
+        """Create detector instance shared across the module (detect() is pure)."""
         return ResourceConflictDetector()
 
-    @pytest.fixture
-    def mods_no_conflicts(self) -> list[Mod]:
+    @pytest.fixture(scope="module")
+    def mods_no_conflicts(self, make_mod: Callable[..., Mod]) -> list[Mod]:
         """Create mods with no resource conflicts."""
-        mod1 = Mod(
-            name="mod1.package",
-            path=Path("/mods/mod1.package"),
-            type=ModType.PACKAGE,
-            size=1000,
+        mod1 = make_mod(
+            "mod1.package",
             hash="hash1",
-            resources=[
-                DBPFResource(
-                    type=0x12345678,
-                    group=0x00000000,
-                    instance=0xAAAAAAAA,
-                    size=100,
-                    offset=0,
-                    compressed_size=0,
-                ),
-            ],
+            resources=[_make_resource(0x12345678, 0xAAAAAAAA, size=100)],
         )
 
-        mod2 = Mod(
-            name="mod2.package",
-            path=Path("/mods/mod2.package"),
-            type=ModType.PACKAGE,
+        mod2 = make_mod(
+            "mod2.package",
             size=2000,
             hash="hash2",
-            resources=[
-                DBPFResource(
-                    type=0x12345678,
-                    group=0x00000000,
-                    instance=0xBBBBBBBB,  # Different instance ID
-                    size=200,
-                    offset=0,
-                    compressed_size=0,
-                ),
-            ],
+            resources=[_make_resource(0x12345678, 0xBBBBBBBB, size=200)],  # Different instance
         )
 
         return [mod1, mod2]
 
-    @pytest.fixture
-    def mods_with_conflict(self) -> list[Mod]:
+    @pytest.fixture(scope="module")
+    def mods_with_conflict(self, make_mod: Callable[..., Mod]) -> list[Mod]:
         """Create mods with resource conflict."""
-        shared_resource = DBPFResource(
-            type=int(DDS_IMAGE),
-            group=0x00000000,
-            instance=0x12345678,
-            size=1000,
-            offset=0,
-            compressed_size=0,
-        )
+        mod1 = make_mod("image_mod_a.package", size=5000, hash="hash_a", resources=(_DDS_RESOURCE,))
 
-        mod1 = Mod(
-            name="image_mod_a.package",
-            path=Path("/mods/image_mod_a.package"),
-            type=ModType.PACKAGE,
-            size=5000,
-            hash="hash_a",
-            resources=[shared_resource],
-        )
-
-        mod2 = Mod(
-            name="image_mod_b.package",
-            path=Path("/mods/image_mod_b.package"),
-            type=ModType.PACKAGE,
-            size=6000,
-            hash="hash_b",
-            resources=[shared_resource],
-        )
+        mod2 = make_mod("image_mod_b.package", size=6000, hash="hash_b", resources=(_DDS_RESOURCE,))
 
         return [mod1, mod2]
 
-    @pytest.fixture
-    def mods_with_critical_conflict(self) -> list[Mod]:
-        """Create mods with critical resource conflict."""
-        critical_resource = DBPFResource(
-            type=int(SIMDATA),
-            group=0x00000000,
-            instance=0x99999999,
-            size=500,
-            offset=0,
-            compressed_size=0,
-        )
+    @pytest.fixture(scope="module")
+    def conflicts_basic(
+        self, detector: ResourceConflictDetector, mods_with_conflict: list[Mod]
+    ) -> list[ModConflict]:
+        """Detect conflicts for ``mods_with_conflict`` once per module."""
+        return detector.detect(mods_with_conflict)
 
-        mod1 = Mod(
-            name="simdata_mod1.package",
-            path=Path("/mods/simdata_mod1.package"),
-            type=ModType.PACKAGE,
-            size=3000,
-            hash="hash1",
-            resources=[critical_resource],
+    @pytest.fixture(scope="module")
+    def mods_with_critical_conflict(self, make_mod: Callable[..., Mod]) -> list[Mod]:
+        """Create mods with critical resource conflict."""
+        mod1 = make_mod(
+            "simdata_mod1.package", size=3000, hash="hash1", resources=(_SIMDATA_RESOURCE,)
         )
 
-        mod2 = Mod(
-            name="simdata_mod2.package",
-            path=Path("/mods/simdata_mod2.package"),
-            type=ModType.PACKAGE,
-            size=3500,
-            hash="hash2",
-            resources=[critical_resource],
+        mod2 = make_mod(
+            "simdata_mod2.package", size=3500, hash="hash2", resources=(_SIMDATA_RESOURCE,)
         )
 
         return [mod1, mod2]
 
-    @pytest.fixture
-    def mods_with_hash_collision(self) -> list[Mod]:
+    @pytest.fixture(scope="module")
+    def conflicts_critical(
+        self, detector: ResourceConflictDetector, mods_with_critical_conflict: list[Mod]
+    ) -> list[ModConflict]:
+        """Detect conflicts for ``mods_with_critical_conflict`` once per module."""
+        return detector.detect(mods_with_critical_conflict)
+
+    @pytest.fixture(scope="module")
+    def mods_with_hash_collision(self, make_mod: Callable[..., Mod]) -> list[Mod]:
         """Create mods with identical hashes (duplicates)."""
         duplicate_hash = "a1b2c3d4e5f6789012345678901234567890abcd"
 
-        mod1 = Mod(
-            name="duplicate_a.package",
-            path=Path("/mods/duplicate_a.package"),
-            type=ModType.PACKAGE,
-            size=10000,
-            hash=duplicate_hash,
-            resources=[],
-        )
+        mod1 = make_mod("duplicate_a.package", size=10000, hash=duplicate_hash)
 
-        mod2 = Mod(
-            name="duplicate_b.package",
-            path=Path("/mods/duplicate_b.package"),
-            type=ModType.PACKAGE,
-            size=10000,
-            hash=duplicate_hash,
-            resources=[],
-        )
+        mod2 = make_mod("duplicate_b.package", size=10000, hash=duplicate_hash)
 
         return [mod1, mod2]
 
-    @pytest.fixture
-    def mods_with_multiple_conflicts(self) -> list[Mod]:
-        """Create mods with multiple resource conflicts."""
-        resource1 = DBPFResource(
-            type=int(DDS_IMAGE),
-            group=0x00000000,
-            instance=0x11111111,
-            size=1000,
-            offset=0,
-            compressed_size=0,
-        )
+    @pytest.fixture(scope="module")
+    def conflicts_hash(
+        self, detector: ResourceConflictDetector, mods_with_hash_collision: list[Mod]
+    ) -> list[ModConflict]:
+        """Detect conflicts for ``mods_with_hash_collision`` once per module."""
+        return detector.detect(mods_with_hash_collision)
 
-        resource2 = DBPFResource(
-            type=GEOM,
-            group=0x00000000,
-            instance=0x22222222,
-            size=2000,
-            offset=0,
-            compressed_size=0,
-        )
+    @pytest.fixture(scope="module")
+    def mods_with_multiple_conflicts(self, make_mod: Callable[..., Mod]) -> list[Mod]:
+        """Create mods with multiple resource conflicts."""
+        resources = [_DDS_RESOURCE, _GEOM_RESOURCE]
 
-        mod1 = Mod(
-            name="multi_mod1.package",
-            path=Path("/mods/multi_mod1.package"),
-            type=ModType.PACKAGE,
-            size=5000,
-            hash="hash1",
-            resources=[resource1, resource2],
-        )
+        mod1 = make_mod("multi_mod1.package", size=5000, hash="hash1", resources=resources)
 
-        mod2 = Mod(
-            name="multi_mod2.package",
-            path=Path("/mods/multi_mod2.package"),
-            type=ModType.PACKAGE,
-            size=6000,
-            hash="hash2",
-            resources=[resource1, resource2],
-        )
+        mod2 = make_mod("multi_mod2.package", size=6000, hash="hash2", resources=resources)
 
         return [mod1, mod2]
 
-    def test_no_conflicts(
-        self, detector: ResourceConflictDetector, mods_no_conflicts: list[Mod]
+    @pytest.fixture(scope="module")
+    def mods_without_resources(self, make_mod: Callable[..., Mod]) -> list[Mod]:
+        """Create a lone mod with no resources."""
+        return [make_mod("empty.package", size=100, hash="hash")]
+
+    @pytest.fixture(scope="module")
+    def mods_without_hash(self, make_mod: Callable[..., Mod]) -> list[Mod]:
+        """Create a lone mod that was scanned without hashing."""
+        return [make_mod("no_hash_mod.package", hash=None)]
+
+    @pytest.fixture(scope="module")
+    def conflicts_multi(
+        self, detector: ResourceConflictDetector, mods_with_multiple_conflicts: list[Mod]
+    ) -> list[ModConflict]:
+        """Detect conflicts for ``mods_with_multiple_conflicts`` once per module."""
+        return detector.detect(mods_with_multiple_conflicts)
+
+    @pytest.mark.parametrize(
+        "mods",
+        [
+            pytest.param("mods_no_conflicts", id="distinct_resources"),
+            pytest.param([], id="empty_mods_list"),
+            pytest.param("mods_without_resources", id="mod_with_no_resources"),
+            # Mods without hashes must not crash hash-collision detection
+            pytest.param("mods_without_hash", id="mod_without_hash"),
+        ],
+    )
+    def test_detect_returns_no_conflicts(
+        self,
+        detector: ResourceConflictDetector,
+        mods: Union[str, list[Mod]],
+        request: pytest.FixtureRequest,
     ) -> None:
-        """Test detection with no conflicts."""
-        conflicts = detector.detect(mods_no_conflicts)
+        """Test inputs that must not produce any conflicts."""
+        if isinstance(mods, str):
+            mods = request.getfixturevalue(mods)
 
-        assert len(conflicts) == 0
+        assert detector.detect(mods) == []
 
-    def test_detect_resource_conflict(
-        self, detector: ResourceConflictDetector, mods_with_conflict: list[Mod]
-    ) -> None:
+    def test_detect_resource_conflict(self, conflicts_basic: list[ModConflict]) -> None:
         """Test detecting a resource conflict."""
-        conflicts = detector.detect(mods_with_conflict)
-
-        assert len(conflicts) == 1
+        assert len(conflicts_basic) == 1
 
-        conflict = conflicts[0]
+        conflict = conflicts_basic[0]
         assert conflict.type == ConflictType.RESOURCE_DUPLICATE
         assert len(conflict.affected_mods) == 2
         assert "image_mod_a.package" in conflict.affected_mods
         assert "image_mod_b.package" in conflict.affected_mods
 
-    def test_conflict_details(
-        self, detector: ResourceConflictDetector, mods_with_conflict: list[Mod]
-    ) -> None:
+    def test_conflict_details(self, conflicts_basic: list[ModConflict]) -> None:
         """Test conflict details are populated correctly."""
-        conflicts = detector.detect(mods_with_conflict)
-        conflict = conflicts[0]
+        details = conflicts_basic[0].details
+        legacy_keys = (
+            "resource_key",
+            "resource_type",
+            "resource_type_hex",
+            "resource_type_name",
+            "mod_count",
+            "is_critical_resource",
+            "affected_mod_names",
+        )
 
-        assert "resource_key" in conflict.details
-        assert "resource_type" in conflict.details
-        assert conflict.details["resource_type"] == int(DDS_IMAGE)
-        assert conflict.details["resource_type_name"] == "DDS Image"
-        assert conflict.details["mod_count"] == 2
+        assert {key: details[key] for key in legacy_keys} == {
+            "resource_key": f"0x{int(DDS_IMAGE):08X}:0x00000000:0x0000000012345678",
+            "resource_type": int(DDS_IMAGE),
+            "resource_type_hex": f"0x{int(DDS_IMAGE):08X}",
+            "resource_type_name": "DDS Image",
+            "mod_count": 2,
+            "is_critical_resource": False,
+            "affected_mod_names": ["image_mod_a.package", "image_mod_b.package"],
+        }
 
     def test_resource_conflict_details_include_v2_kind_and_recommendation(
-        self, detector: ResourceConflictDetector, mods_with_conflict: list[Mod]
+        self, conflicts_basic: list[ModConflict]
     ) -> None:
         """Test resource conflicts include additive v2 explanation metadata."""
-        conflicts = detector.detect(mods_with_conflict)
-        conflict = conflicts[0]
+        conflict = conflicts_basic[0]
 
         assert conflict.details["conflict_kind"] == "likely_override"
         assert conflict.details["review_status"] == "needs_review"
@@ -244,12 +212,9 @@ class TestResourceConflictDetector:
         assert conflict.details["recommendation"]["confidence"] == "medium"
         assert conflict.details["recommendation"]["message"]
 
-    def test_conflict_description(
-        self, detector: ResourceConflictDetector, mods_with_conflict: list[Mod]
-    ) -> None:
+    def test_conflict_description(self, conflicts_basic: list[ModConflict]) -> None:
         """Test conflict description is generated."""
-        conflicts = detector.detect(mods_with_conflict)
-        conflict = conflicts[0]
+        conflict = conflicts_basic[0]
 
         assert len(conflict.description) > 0
         assert "DDS Image" in conflict.description
@@ -260,21 +225,13 @@ class TestResourceConflictDetector:
     ) -> None:
         """Test conflict details include honest simulated load-order winner metadata."""
         mods_dir = tmp_path / "Mods"
-        shared_resource = DBPFResource(
-            type=int(DDS_IMAGE),
-            group=0x00000000,
-            instance=0x12345678,
-            size=1000,
-            offset=0,
-            compressed_size=0,
-        )
         base_mod = Mod(
             name="base.package",
             path=mods_dir / "base.package",
             type=ModType.PACKAGE,
             size=5000,
             hash="base_hash",
-            resources=[shared_resource],
+            resources=(_DDS_RESOURCE,),
         )
         override_mod = Mod(
             name="override.package",
@@ -282,7 +239,7 @@ class TestResourceConflictDetector:
             type=ModType.PACKAGE,
             size=5000,
             hash="override_hash",
-            resources=[shared_resource],
+            resources=(_DDS_RESOURCE,),
         )
         cfg = parse_resource_cfg_text(
             """
@@ -333,74 +290,54 @@ class TestResourceConflictDetector:
         assert conflict.details["recommendation"]["confidence"] == "configured"
         assert "Simulated winner: override.package" in conflict.description
 
-    def test_critical_resource_severity(
-        self,
-        detector: ResourceConflictDetector,
-        mods_with_critical_conflict: list[Mod],
-    ) -> None:
+    def test_critical_resource_severity(self, conflicts_critical: list[ModConflict]) -> None:
         """Test critical resources get CRITICAL severity."""
-        conflicts = detector.detect(mods_with_critical_conflict)
-        conflict = conflicts[0]
+        conflict = conflicts_critical[0]
 
         # SimData is critical resource type
         assert conflict.severity == Severity.CRITICAL
         assert conflict.details["is_critical_resource"] is True
         assert "critical resource" in conflict.description.lower()
 
-    def test_non_critical_resource_severity(
-        self, detector: ResourceConflictDetector, mods_with_conflict: list[Mod]
-    ) -> None:
+    def test_non_critical_resource_severity(self, conflicts_basic: list[ModConflict]) -> None:
         """Test non-critical resources get appropriate severity."""
-        conflicts = detector.detect(mods_with_conflict)
-        conflict = conflicts[0]
+        conflict = conflicts_basic[0]
 
         # DDS Image with 2 mods = LOW (from RESOURCE_DUPLICATE rules)
         assert conflict.severity == Severity.LOW
         assert conflict.details["is_critical_resource"] is False
 
-    def test_hash_collision_detection(
-        self,
-        detector: ResourceConflictDetector,
-        mods_with_hash_collision: list[Mod],
-    ) -> None:
+    def test_hash_collision_detection(self, conflicts_hash: list[ModConflict]) -> None:
         """Test detecting hash collisions (duplicate files)."""
-        conflicts = detector.detect(mods_with_hash_collision)
-
-        assert len(conflicts) == 1
+        assert len(conflicts_hash) == 1
 
-        conflict = conflicts[0]
+        conflict = conflicts_hash[0]
         assert conflict.type == ConflictType.RESOURCE_DUPLICATE
         assert "file_hash" in conflict.details
         assert conflict.details["mod_count"] == 2
         assert "duplicate" in conflict.description.lower()
 
-    def test_hash_collision_details(
-        self,
-        detector: ResourceConflictDetector,
-        mods_with_hash_collision: list[Mod],
-    ) -> None:
+    def test_hash_collision_details(self, conflicts_hash: list[ModConflict]) -> None:
         """Test hash collision details."""
-        conflicts = detector.detect(mods_with_hash_collision)
-        conflict = conflicts[0]
-
-        assert conflict.details["file_hash"] == "a1b2c3d4e5f6789012345678901234567890abcd"
-        assert conflict.details["total_size"] == 20000  # 10000 + 10000
-        assert len(conflict.details["affected_mod_names"]) == 2
-        assert conflict.details["conflict_kind"] == "exact_duplicate"
-        assert conflict.details["recommendation"]["action"] == "keep_one_copy"
+        details = dict(conflicts_hash[0].details)
+        recommendation = details.pop("recommendation")
+
+        assert details == {
+            "file_hash": "a1b2c3d4e5f6789012345678901234567890abcd",
+            "mod_count": 2,
+            "affected_mod_names": ["duplicate_a.package", "duplicate_b.package"],
+            "total_size": 20000,  # 10000 + 10000
+            "conflict_kind": "exact_duplicate",
+            "review_status": "duplicate_file",
+        }
+        assert recommendation["action"] == "keep_one_copy"
 
     def test_resource_conflict_kind_identifies_default_replacement_ambiguity(
         self,
+        make_mod: Callable[..., Mod],
     ) -> None:
         """Test override/default replacement names stay ambiguous, not erroneous."""
-        shared_resource = DBPFResource(
-            type=int(CASP),
-            group=0x00000000,
-            instance=0x12345678,
-            size=1000,
-            offset=0,
-            compressed_size=0,
-        )
+        shared_resource = _make_resource(int(CASP), 0x12345678)
         mods = [
             Mod(
                 name="eyes_default_replacement.package",
@@ -408,16 +345,9 @@ class TestResourceConflictDetector:
                 type=ModType.PACKAGE,
                 size=1000,
                 hash="a",
-                resources=[shared_resource],
-            ),
-            Mod(
-                name="eyes.package",
-                path=Path("/mods/eyes.package"),
-                type=ModType.PACKAGE,
-                size=1000,
-                hash="b",
-                resources=[shared_resource],
+                resources=(shared_resource,),
             ),
+            make_mod("eyes.package", hash="b", resources=(shared_resource,)),
         ]
 
         conflict = ResourceConflictDetector().detect(mods)[0]
@@ -427,33 +357,14 @@ class TestResourceConflictDetector:
         assert conflict.details["recommendation"]["action"] == "verify_default_replacement"
         assert "not automatically an error" in conflict.details["recommendation"]["message"]
 
-    def test_resource_conflict_kind_identifies_ui_conflict(self) -> None:
+    def test_resource_conflict_kind_identifies_ui_conflict(
+        self, make_mod: Callable[..., Mod]
+    ) -> None:
         """Test UI-flavored resources get a UI-specific conflict kind."""
-        shared_resource = DBPFResource(
-            type=0x03E9D964,
-            group=0x00000000,
-            instance=0x12345678,
-            size=1000,
-            offset=0,
-            compressed_size=0,
-        )
+        shared_resource = _make_resource(0x03E9D964, 0x12345678)
         mods = [
-            Mod(
-                name="ui_a.package",
-                path=Path("/mods/ui_a.package"),
-                type=ModType.PACKAGE,
-                size=1000,
-                hash="a",
-                resources=[shared_resource],
-            ),
-            Mod(
-                name="ui_b.package",
-                path=Path("/mods/ui_b.package"),
-                type=ModType.PACKAGE,
-                size=1000,
-                hash="b",
-                resources=[shared_resource],
-            ),
+            make_mod("ui_a.package", hash="a", resources=(shared_resource,)),
+            make_mod("ui_b.package", hash="b", resources=(shared_resource,)),
         ]
 
         conflict = ResourceConflictDetector().detect(mods)[0]
@@ -461,41 +372,25 @@ class TestResourceConflictDetector:
         assert conflict.details["conflict_kind"] == "ui_conflict"
         assert conflict.details["recommendation"]["action"] == "review_ui_mod_compatibility"
 
-    def test_multiple_conflicts(
-        self,
-        detector: ResourceConflictDetector,
-        mods_with_multiple_conflicts: list[Mod],
-    ) -> None:
+    def test_multiple_conflicts(self, conflicts_multi: list[ModConflict]) -> None:
         """Test detecting multiple conflicts."""
-        conflicts = detector.detect(mods_with_multiple_conflicts)
-
         # Should find 2 resource key conflicts
-        assert len(conflicts) == 2
+        assert len(conflicts_multi) == 2
 
         # Check resource types
-        resource_types = {c.details["resource_type_name"] for c in conflicts}
+        resource_types = {c.details["resource_type_name"] for c in conflicts_multi}
         assert "DDS Image" in resource_types
         assert "Geometry" in resource_types
 
-    def test_three_way_conflict(self, detector: ResourceConflictDetector) -> None:
+    def test_three_way_conflict(
+        self, make_mod: Callable[..., Mod], detector: ResourceConflictDetector
+    ) -> None:
         """Test conflict with three mods."""
-        shared_resource = DBPFResource(
-            type=int(OBJD),
-            group=0x00000000,
-            instance=0xDEADBEEF,
-            size=1000,
-            offset=0,
-            compressed_size=0,
-        )
+        shared_resource = _make_resource(int(OBJD), 0xDEADBEEF)
 
         mods = [
-            Mod(
-                name=f"obj_mod{i}.package",
-                path=Path(f"/mods/obj_mod{i}.package"),
-                type=ModType.PACKAGE,
-                size=2000,
-                hash=f"hash{i}",
-                resources=[shared_resource],
+            make_mod(
+                f"obj_mod{i}.package", size=2000, hash=f"hash{i}", resources=(shared_resource,)
             )
             for i in range(3)
         ]
@@ -510,132 +405,70 @@ class TestResourceConflictDetector:
     def test_get_critical_conflicts(
         self,
         detector: ResourceConflictDetector,
-        mods_with_critical_conflict: list[Mod],
+        conflicts_critical: list[ModConflict],
     ) -> None:
         """Test filtering for critical conflicts."""
-        conflicts = detector.detect(mods_with_critical_conflict)
-
-        critical_conflicts = detector.get_critical_conflicts(conflicts)
+        critical_conflicts = detector.get_critical_conflicts(conflicts_critical)
         assert len(critical_conflicts) == 1
         assert critical_conflicts[0].details["is_critical_resource"] is True
 
     def test_get_conflicts_by_type(
         self,
         detector: ResourceConflictDetector,
-        mods_with_multiple_conflicts: list[Mod],
+        conflicts_multi: list[ModConflict],
     ) -> None:
         """Test filtering conflicts by resource type."""
-        conflicts = detector.detect(mods_with_multiple_conflicts)
-
-        image_conflicts = detector.get_conflicts_by_type(conflicts, "DDS Image")
+        image_conflicts = detector.get_conflicts_by_type(conflicts_multi, "DDS Image")
         assert len(image_conflicts) == 1
         assert image_conflicts[0].details["resource_type_name"] == "DDS Image"
 
-        geometry_conflicts = detector.get_conflicts_by_type(conflicts, "Geometry")
+        geometry_conflicts = detector.get_conflicts_by_type(conflicts_multi, "Geometry")
         assert len(geometry_conflicts) == 1
         assert geometry_conflicts[0].details["resource_type_name"] == "Geometry"
 
         # Non-existent type
-        audio_conflicts = detector.get_conflicts_by_type(conflicts, "Audio")
+        audio_conflicts = detector.get_conflicts_by_type(conflicts_multi, "Audio")
         assert len(audio_conflicts) == 0
 
     def test_get_hash_collision_conflicts(
         self,
         detector: ResourceConflictDetector,
-        mods_with_hash_collision: list[Mod],
+        conflicts_hash: list[ModConflict],
     ) -> None:
         """Test filtering for hash collision conflicts."""
-        conflicts = detector.detect(mods_with_hash_collision)
-
-        hash_conflicts = detector.get_hash_collision_conflicts(conflicts)
+        hash_conflicts = detector.get_hash_collision_conflicts(conflicts_hash)
         assert len(hash_conflicts) == 1
         assert "file_hash" in hash_conflicts[0].details
 
     def test_get_conflict_summary(
         self,
         detector: ResourceConflictDetector,
-        mods_with_multiple_conflicts: list[Mod],
+        conflicts_multi: list[ModConflict],
     ) -> None:
         """Test getting conflict summary statistics."""
-        conflicts = detector.detect(mods_with_multiple_conflicts)
-
-        summary = detector.get_conflict_summary(conflicts)
-
-        assert summary["total_conflicts"] == 2
-        assert "by_resource_type" in summary
-        assert summary["by_resource_type"]["DDS Image"] == 1
-        assert summary["by_resource_type"]["Geometry"] == 1
-        assert summary["resource_key_conflicts"] == 2
-        assert summary["hash_collision_conflicts"] == 0
-
-    def test_empty_mods_list(self, detector: ResourceConflictDetector) -> None:
-        """Test with empty mods list."""
-        conflicts = detector.detect([])
-
-        assert len(conflicts) == 0
-
-    def test_mod_with_no_resources(self, detector: ResourceConflictDetector) -> None:
-        """Test mod with no resources."""
-        mod = Mod(
-            name="empty.package",
-            path=Path("/mods/empty.package"),
-            type=ModType.PACKAGE,
-            size=100,
-            hash="hash",
-            resources=[],  # No resources
-        )
-
-        conflicts = detector.detect([mod])
-        assert len(conflicts) == 0
+        summary = detector.get_conflict_summary(conflicts_multi)
+
+        assert summary == {
+            "total_conflicts": 2,
+            "critical_resource_conflicts": 0,
+            "hash_collision_conflicts": 0,
+            "resource_key_conflicts": 2,
+            "by_resource_type": {"DDS Image": 1, "Geometry": 1},
+        }
 
-    def test_mixed_conflicts(self, detector: ResourceConflictDetector) -> None:
+    def test_mixed_conflicts(
+        self, make_mod: Callable[..., Mod], detector: ResourceConflictDetector
+    ) -> None:
         """Test both resource key and hash collision conflicts."""
-        shared_resource = DBPFResource(
-            type=int(DDS_IMAGE),
-            group=0x00000000,
-            instance=0x12345678,
-            size=1000,
-            offset=0,
-            compressed_size=0,
-        )
-
         duplicate_hash = "duplicate_hash_value"
 
-        mod1 = Mod(
-            name="mod1.package",
-            path=Path("/mods/mod1.package"),
-            type=ModType.PACKAGE,
-            size=5000,
-            hash="unique_hash_1",
-            resources=[shared_resource],
-        )
+        mod1 = make_mod("mod1.package", size=5000, hash="unique_hash_1", resources=(_DDS_RESOURCE,))
 
-        mod2 = Mod(
-            name="mod2.package",
-            path=Path("/mods/mod2.package"),
-            type=ModType.PACKAGE,
-            size=5000,
-            hash="unique_hash_2",
-            resources=[shared_resource],
-        )
+        mod2 = make_mod("mod2.package", size=5000, hash="unique_hash_2", resources=(_DDS_RESOURCE,))
 
-        mod3 = Mod(
-            name="duplicate_a.package",
-            path=Path("/mods/duplicate_a.package"),
-            type=ModType.PACKAGE,
-            size=3000,
-            hash=duplicate_hash,
-            resources=[],
-        )
+        mod3 = make_mod("duplicate_a.package", size=3000, hash=duplicate_hash)
 
-        mod4 = Mod(
-            name="duplicate_b.package",
-            path=Path("/mods/duplicate_b.package"),
-            type=ModType.PACKAGE,
-            size=3000,
-            hash=duplicate_hash,
-            resources=[],
-        )
+        mod4 = make_mod("duplicate_b.package", size=3000, hash=duplicate_hash)
 
         conflicts = detector.detect([mod1, mod2, mod3, mod4])
 
@@ -649,13 +482,21 @@ class TestResourceConflictDetector:
         assert len(resource_conflicts) == 1
         assert len(hash_conflicts) == 1
 
-    def test_resource_type_names(self, detector: ResourceConflictDetector) -> None:
+    @pytest.mark.parametrize(
+        ("resource_type", "expected_name"),
+        [
+            (int(SIMDATA), "SimData"),
+            (int(OBJD), "Object Definition"),
+            (int(DDS_IMAGE), "DDS Image"),
+            (GEOM, "Geometry"),
+            (0x99999999, "Unknown"),
+        ],
+    )
+    def test_resource_type_names(
+        self, detector: ResourceConflictDetector, resource_type: int, expected_name: str
+    ) -> None:
         """Test resource type name mapping."""
-        assert detector._get_resource_type_name(int(SIMDATA)) == "SimData"
-        assert detector._get_resource_type_name(int(OBJD)) == "Object Definition"
-        assert detector._get_resource_type_name(int(DDS_IMAGE)) == "DDS Image"
-        assert detector._get_resource_type_name(GEOM) == "Geometry"
-        assert detector._get_resource_type_name(0x99999999) == "Unknown"
+        assert detector._get_resource_type_name(resource_type) == expected_name
 
     def test_critical_resource_types_are_verified_core_types(
         self, detector: ResourceConflictDetector
@@ -671,28 +512,10 @@ class TestResourceConflictDetector:
         assert detector._get_resource_type_name(0x034AEECB) == "CAS Part"
         assert detector._get_resource_type_name(0x00B2D882) == "DST Image"
 
-    def test_conflict_has_resolution(
-        self, detector: ResourceConflictDetector, mods_with_conflict: list[Mod]
-    ) -> None:
+    def test_conflict_has_resolution(self, conflicts_basic: list[ModConflict]) -> None:
         """Test conflicts include resolution suggestions."""
-        conflicts = detector.detect(mods_with_conflict)
-        conflict = conflicts[0]
+        conflict = conflicts_basic[0]
 
         assert conflict.resolution is not None
         assert len(conflict.resolution) > 0
         assert "duplicate" in conflict.resolution.lower()
-
-    def test_mods_without_hash(self, detector: ResourceConflictDetector) -> None:
-        """Test handling mods without hash values."""
-        mod1 = Mod(
-            name="no_hash_mod.package",
-            path=Path("/mods/no_hash_mod.package"),
-            type=ModType.PACKAGE,
-            size=1000,
-            hash=None,  # No hash
-            resources=[],
-        )
-
-        conflicts = detector.detect([mod1])
-        # Should not crash, no hash collisions detected
-        assert len(conflicts) == 0
@@ -1,5 +1,6 @@
 """Tests for DBPF parser."""
 
+import dataclasses
 import struct
 import zlib
 from pathlib import Path
@@ -14,148 +15,135 @@ from simanalysis.parsers.dbpf import DBPFReader
 pytestmark = pytest.mark.synthetic
 
 
-class TestDBPFReader:
-    """Tests for DBPFReader class."""
-
-    @pytest.fixture
-    def valid_dbpf_file(self, tmp_path: Path) -> Path:
-        """Create a valid minimal DBPF file for testing."""
-        dbpf_file = tmp_path / "test.package"
-
-        # Create valid DBPF header (96 bytes)
-        header = bytearray(96)
-
-        # Magic "DBPF"
-        header[0:4] = b"DBPF"
-
-        # Major version = 2
-        header[4:8] = struct.pack("<I", 2)
-
-        # Minor version = 0
-        header[8:12] = struct.pack("<I", 0)
-
-        # User version = 0
-        header[12:16] = struct.pack("<I", 0)
-
-        # Flags = 0 (skip)
-        header[16:20] = struct.pack("<I", 0)
-
-        # Created date = 0 (skip)
-        header[20:24] = struct.pack("<I", 0)
-
-        # Modified date = 0 (skip)
-        header[24:28] = struct.pack("<I", 0)
-
-        # Index version = 0 (skip)
-        header[28:32] = struct.pack("<I", 0)
-
-        # 4 bytes reserved (skip)
-        header[32:36] = struct.pack("<I", 0)
-
-        # DBPF 2.0 spec (Sims 4):
-        # Index count at offset 36
-        header[36:40] = struct.pack("<I", 2)
+# DBPF 2.0 header (96 bytes): magic, major, minor, user version, flags, created,
+# modified, index version, reserved, index count (36), reserved (40), index size (44),
+# 16 reserved bytes, index offset (64), 28 reserved bytes.
+_HEADER_STRUCT = struct.Struct("<4s11I16xI28x")
+
+# Full 32-byte index entry (mnIndexType=0): type, group, instanceHi, instanceLo,
+# chunkOffset, fileSize, memSize, compressed, committed.
+_INDEX_ENTRY_STRUCT = struct.Struct("<7I2H")
+
+
+def _dbpf_header(
+    *,
+    magic: bytes = b"DBPF",
+    major: int = 2,
+    minor: int = 0,
+    index_count: int = 0,
+    index_size: int = 0,
+    index_offset: int = 96,
+) -> bytes:
+    """Pack a DBPF header; the fields tests never vary are zero."""
+    return _HEADER_STRUCT.pack(
+        magic, major, minor, 0, 0, 0, 0, 0, 0, index_count, 0, index_size, index_offset
+    )
+
+
+# Payloads of the valid package; level 1 is plenty for a test fixture's zlib stream
+_TUNING_PAYLOAD = b"<I>Test Generic Tuning Data</I>"
+_SIMDATA_PAYLOAD = b"This is test SimData that will be compressed" * 10
+_SIMDATA_COMPRESSED = zlib.compress(_SIMDATA_PAYLOAD, 1)
+
+
+def _build_valid_dbpf() -> bytes:
+    """Build a valid minimal DBPF package: two resources, one zlib-compressed."""
+    # Index: a 32-bit mnIndexType flags word (0 = no constant fields) followed by
+    # two full 32-byte entries, so the index size is 4 + 2 * 32 = 68.
+    index_size = 4 + 2 * _INDEX_ENTRY_STRUCT.size
+    entry1_offset = _HEADER_STRUCT.size + 4
+    entry2_offset = entry1_offset + _INDEX_ENTRY_STRUCT.size
+
+    # Resource 1: Generic tuning (uncompressed), stored right after header + index
+    resource1_offset = _HEADER_STRUCT.size + index_size
+    resource1_size = len(_TUNING_PAYLOAD)
+
+    # Resource 2: SimData (zlib-compressed)
+    resource2_offset = resource1_offset + resource1_size
+
+    # Pack everything in place into one preallocated buffer
+    buf = bytearray(resource2_offset + len(_SIMDATA_COMPRESSED))
+    buf[: _HEADER_STRUCT.size] = _dbpf_header(index_count=2, index_size=index_size)
+    # mnIndexType at offset 96 stays 0 (no constant fields): the buffer is zero-filled
+    _INDEX_ENTRY_STRUCT.pack_into(
+        buf,
+        entry1_offset,
+        int(TUNING_GENERIC),
+        0x00000000,  # group
+        0x12345678,  # instance high
+        0x90ABCDEF,  # instance low
+        resource1_offset,
+        resource1_size,  # file size (on disk)
+        resource1_size,  # mem size (uncompressed)
+        0x0000,  # compressed: none
+        1,  # committed
+    )
+    _INDEX_ENTRY_STRUCT.pack_into(
+        buf,
+        entry2_offset,
+        int(SIMDATA),
+        0x00000000,  # group
+        0xFEDCBA09,  # instance high
+        0x87654321,  # instance low
+        resource2_offset,
+        len(_SIMDATA_COMPRESSED),  # file size (compressed)
+        len(_SIMDATA_PAYLOAD),  # mem size (uncompressed)
+        0x5A42,  # compressed: zlib
+        1,  # committed
+    )
+    buf[resource1_offset:resource2_offset] = _TUNING_PAYLOAD
+    buf[resource2_offset:] = _SIMDATA_COMPRESSED
+
+    return bytes(buf)
+
+
+# Built once at import; every test reads the same immutable package bytes.
+_VALID_DBPF_BYTES = _build_valid_dbpf()
 
-        # Unknown/reserved at offset 40 (set to 0, parser will use offset 64)
-        header[40:44] = struct.pack("<I", 0)
 
-        # Index size at offset 44 (4-byte flags word + 2 entries * 32 bytes = 68)
-        header[44:48] = struct.pack("<I", 68)
-
-        # Reserved bytes 48-64
-        header[48:64] = bytes(16)
-
-        # Index offset at offset 64 (right after header = 96)
-        header[64:68] = struct.pack("<I", 96)
-
-        # Rest of header is zeros/reserved
-        header[68:96] = bytes(28)
-
-        # Build a real Sims 4 DBPF v2 index: a 32-bit mnIndexType flags word
-        # followed by the entries. Here mnIndexType=0 (no constant fields), so
-        # every entry is the full 32 bytes:
-        #   type(4) group(4) instanceHi(4) instanceLo(4) chunkOffset(4)
-        #   fileSize(4) memSize(4) compressed(2) committed(2)
-        index_block_size = 4 + 2 * 32  # flags word + two 32-byte entries
-        index = bytearray()
-        index += struct.pack("<I", 0)  # mnIndexType: no constant fields
-
-        # Resource 1: Generic tuning (uncompressed)
-        resource1_offset = 96 + index_block_size  # after header + index
-        resource1_data = b"<I>Test Generic Tuning Data</I>"
-        resource1_size = len(resource1_data)
-        index += struct.pack("<I", int(TUNING_GENERIC))  # type
-        index += struct.pack("<I", 0x00000000)  # group
-        index += struct.pack("<I", 0x12345678)  # instance high
-        index += struct.pack("<I", 0x90ABCDEF)  # instance low
-        index += struct.pack("<I", resource1_offset)  # chunk offset
-        index += struct.pack("<I", resource1_size)  # file size (on disk)
-        index += struct.pack("<I", resource1_size)  # mem size (uncompressed)
-        index += struct.pack("<H", 0x0000)  # compressed: none
-        index += struct.pack("<H", 1)  # committed
-
-        # Resource 2: SimData (zlib-compressed)
-        resource2_data = b"This is test SimData that will be compressed" * 10
-        resource2_compressed = zlib.compress(resource2_data)
-        resource2_size = len(resource2_data)
-        resource2_compressed_size = len(resource2_compressed)
-        resource2_offset = resource1_offset + resource1_size
-        index += struct.pack("<I", int(SIMDATA))  # type
-        index += struct.pack("<I", 0x00000000)  # group
-        index += struct.pack("<I", 0xFEDCBA09)  # instance high
-        index += struct.pack("<I", 0x87654321)  # instance low
-        index += struct.pack("<I", resource2_offset)  # chunk offset
-        index += struct.pack("<I", resource2_compressed_size)  # file size (compressed)
-        index += struct.pack("<I", resource2_size)  # mem size (uncompressed)
-        index += struct.pack("<H", 0x5A42)  # compressed: zlib
-        index += struct.pack("<H", 1)  # committed
-
-        # Write complete file
-        with open(dbpf_file, "wb") as f:
-            f.write(header)
-            f.write(index)
-            f.write(resource1_data)
-            f.write(resource2_compressed)
+class TestDBPFReader:
+    """Tests for DBPFReader class."""
 
+    @pytest.fixture(scope="session")
+    def valid_dbpf_file(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Write the valid minimal DBPF file once per session (tests only read it)."""
+        dbpf_file = tmp_path_factory.mktemp("dbpf") / "test.package"
+        dbpf_file.write_bytes(_VALID_DBPF_BYTES)
         return dbpf_file
 
-    @pytest.fixture
-    def invalid_magic_file(self, tmp_path: Path) -> Path:
-        """Create a file with invalid DBPF magic."""
-        invalid_file = tmp_path / "invalid.package"
-
-        header = bytearray(96)
-        header[0:4] = b"ABCD"  # Invalid magic
-        header[4:8] = struct.pack("<I", 2)  # Valid version
+    @pytest.fixture(scope="module")
+    def reader(self, valid_dbpf_file: Path) -> DBPFReader:
+        """Share one reader over the valid package with header and index already loaded."""
+        reader = DBPFReader(valid_dbpf_file)
+        # Touch the lazy properties so the header and index are parsed once, up front
+        _ = reader.header, reader.resources
+        return reader
 
-        with open(invalid_file, "wb") as f:
-            f.write(header)
+    @pytest.fixture(scope="session")
+    def invalid_dbpf_dir(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Directory holding the broken packages, created once per session."""
+        return tmp_path_factory.mktemp("dbpf_invalid")
 
+    @pytest.fixture(scope="session")
+    def invalid_magic_file(self, invalid_dbpf_dir: Path) -> Path:
+        """Create a file with invalid DBPF magic."""
+        invalid_file = invalid_dbpf_dir / "invalid.package"
+        invalid_file.write_bytes(_dbpf_header(magic=b"ABCD"))  # Invalid magic, valid version
         return invalid_file
 
-    @pytest.fixture
-    def invalid_version_file(self, tmp_path: Path) -> Path:
+    @pytest.fixture(scope="session")
+    def invalid_version_file(self, invalid_dbpf_dir: Path) -> Path:
         """Create a file with invalid DBPF version."""
-        invalid_file = tmp_path / "invalid_version.package"
-
-        header = bytearray(96)
-        header[0:4] = b"DBPF"  # Valid magic
-        header[4:8] = struct.pack("<I", 1)  # Invalid version (should be 2)
-
-        with open(invalid_file, "wb") as f:
-            f.write(header)
-
+        invalid_file = invalid_dbpf_dir / "invalid_version.package"
+        invalid_file.write_bytes(_dbpf_header(major=1))  # Invalid version (should be 2)
         return invalid_file
 
-    @pytest.fixture
-    def truncated_file(self, tmp_path: Path) -> Path:
+    @pytest.fixture(scope="session")
+    def truncated_file(self, invalid_dbpf_dir: Path) -> Path:
         """Create a truncated DBPF file."""
-        truncated_file = tmp_path / "truncated.package"
-
+        truncated_file = invalid_dbpf_dir / "truncated.package"
         # Only 50 bytes (less than 96 byte header)
-        with open(truncated_file, "wb") as f:
-            f.write(b"DBPF" + bytes(46))
-
+        truncated_file.write_bytes(b"DBPF" + bytes(46))
         return truncated_file
 
     def test_init_nonexistent_file(self) -> None:
@@ -168,9 +156,8 @@ class TestDBPFReader:
         with pytest.raises(DBPFError, match="Path is not a file"):
             DBPFReader(tmp_path)
 
-    def test_read_header_valid(self, valid_dbpf_file: Path) -> None:
+    def test_read_header_valid(self, reader: DBPFReader) -> None:
         """Test reading valid DBPF header."""
-        reader = DBPFReader(valid_dbpf_file)
         header = reader.read_header()
 
         assert isinstance(header, DBPFHeader)
@@ -204,9 +191,8 @@ class TestDBPFReader:
         with pytest.raises(DBPFError, match="File too small"):
             reader.read_header()
 
-    def test_read_index_valid(self, valid_dbpf_file: Path) -> None:
+    def test_read_index_valid(self, reader: DBPFReader) -> None:
         """Test reading valid index table."""
-        reader = DBPFReader(valid_dbpf_file)
         resources = reader.read_index()
 
         assert len(resources) == 2
@@ -265,13 +251,7 @@ class TestDBPFReader:
             index += struct.pack("<H", 1)  # committed
             blob += payload
 
-        header = bytearray(96)
-        header[0:4] = b"DBPF"
-        header[4:8] = struct.pack("<I", 2)  # major version
-        header[8:12] = struct.pack("<I", 1)  # minor version
-        header[36:40] = struct.pack("<I", n)  # index count
-        header[44:48] = struct.pack("<I", len(index))  # index size
-        header[64:68] = struct.pack("<I", 96)  # index offset
+        header = _dbpf_header(minor=1, index_count=n, index_size=len(index))
 
         with open(dbpf_file, "wb") as f:
             f.write(header)
@@ -302,34 +282,56 @@ class TestDBPFReader:
         # Offsets/sizes parsed from variable-size entries extract correctly.
         assert reader.get_resource(resources[2]) == b"three"
 
-    def test_get_resource_uncompressed(self, valid_dbpf_file: Path) -> None:
+    def test_get_resource_uncompressed(self, reader: DBPFReader) -> None:
         """Test extracting uncompressed resource."""
-        reader = DBPFReader(valid_dbpf_file)
-        resources = reader.read_index()
+        resources = reader.resources
 
         # Get first resource (uncompressed tuning)
         data = reader.get_resource(resources[0])
 
-        assert isinstance(data, bytes)
-        assert b"Test Generic Tuning Data" in data
+        assert data == _TUNING_PAYLOAD
         assert len(data) == resources[0].size
 
-    def test_get_resource_compressed(self, valid_dbpf_file: Path) -> None:
+    def test_get_resource_compressed(self, reader: DBPFReader) -> None:
         """Test extracting compressed resource."""
-        reader = DBPFReader(valid_dbpf_file)
-        resources = reader.read_index()
+        resources = reader.resources
 
         # Get second resource (compressed SimData)
         data = reader.get_resource(resources[1])
 
-        assert isinstance(data, bytes)
-        assert b"This is test SimData" in data
+        assert data == _SIMDATA_PAYLOAD
         assert len(data) == resources[1].size
 
-    def test_get_resources_by_type(self, valid_dbpf_file: Path) -> None:
-        """Test filtering resources by type."""
-        reader = DBPFReader(valid_dbpf_file)
+    def test_get_resource_caps_declared_size_buffer(
+        self, reader: DBPFReader, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a corrupt uncompressed size doesn't size the zlib output buffer."""
+        bufsizes: list[int] = []
+        real_decompress = zlib.decompress
+
+        def tracking_decompress(data: bytes, wbits: int = 15, bufsize: int = 16384) -> bytes:
+            bufsizes.append(bufsize)
+            return real_decompress(data, wbits, bufsize)
+
+        monkeypatch.setattr(zlib, "decompress", tracking_decompress)
+        corrupt = dataclasses.replace(reader.resources[1], size=0xFFFFFFFF)
+
+        with pytest.raises(DBPFError, match="Decompressed size mismatch"):
+            reader.get_resource(corrupt)
+
+        assert bufsizes == [64 << 20]
 
+    def test_context_manager_reads_from_mapping(self, valid_dbpf_file: Path) -> None:
+        """Test that an entered reader maps the package and unmaps it on exit."""
+        with DBPFReader(valid_dbpf_file) as reader:
+            assert reader._mmap is not None
+            data = [reader.get_resource(r) for r in reader.resources]
+
+        assert reader._mmap is None
+        assert data == [_TUNING_PAYLOAD, _SIMDATA_PAYLOAD]
+
+    def test_get_resources_by_type(self, reader: DBPFReader) -> None:
+        """Test filtering resources by type."""
         # Get generic tuning resources
         tuning_resources = reader.get_resources_by_type(int(TUNING_GENERIC))
         assert len(tuning_resources) == 1
@@ -344,9 +346,8 @@ class TestDBPFReader:
         nonexistent = reader.get_resources_by_type(0xFFFFFFFF)
         assert len(nonexistent) == 0
 
-    def test_get_resource_count(self, valid_dbpf_file: Path) -> None:
+    def test_get_resource_count(self, reader: DBPFReader) -> None:
         """Test getting resource count."""
-        reader = DBPFReader(valid_dbpf_file)
         count = reader.get_resource_count()
 
         assert count == 2
@@ -387,10 +388,9 @@ class TestDBPFReader:
         header2 = reader.header
         assert header is header2
 
-    def test_resource_key_property(self, valid_dbpf_file: Path) -> None:
+    def test_resource_key_property(self, reader: DBPFReader) -> None:
         """Test DBPFResource.key property."""
-        reader = DBPFReader(valid_dbpf_file)
-        resources = reader.read_index()
+        resources = reader.resources
 
         res1_key = resources[0].key
         assert isinstance(res1_key, tuple)
@@ -1,5 +1,6 @@
 """Tests for TS4Script analyzer."""
 
+import json
 import zipfile
 from pathlib import Path
 
@@ -201,6 +202,22 @@ def broken_function(
         assert isinstance(modules[0], ScriptModule)
         assert modules[0].name == "test_module.py"
 
+    def test_deep_elif_chain_is_analyzed(self, tmp_path: Path) -> None:
+        """Test a generated 300-branch elif chain does not exhaust the recursion limit."""
+        script_file = tmp_path / "generated.ts4script"
+        branches = "".join(f"    elif x == {i}:\n        return {i}\n" for i in range(1, 300))
+        source = "def lookup(x):\n    if x == 0:\n        return 0\n" + branches
+
+        with zipfile.ZipFile(script_file, "w") as zf:
+            zf.writestr("generated.py", source)
+
+        analyzer = ScriptAnalyzer(script_file)
+        modules = analyzer.list_modules()
+
+        assert [m.name for m in modules] == ["generated.py"]
+        assert modules[0].complexity == 301  # One function plus 300 branches
+        assert analyzer.analyze_module("generated.py").complexity == 301
+
     def test_list_multiple_modules(self, complex_script: Path) -> None:
         """Test listing multiple modules."""
         analyzer = ScriptAnalyzer(complex_script)
@@ -354,3 +371,94 @@ import sys, os
         assert "sims4.utils" in imports
         assert "sys" in imports
         assert "os" in imports
+
+    def test_cache_dir_reuses_results(
+        self, simple_script_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a second analyzer reads metadata and modules from the cache."""
+        cache_dir = tmp_path / "cache"
+        first = ScriptAnalyzer(simple_script_file, cache_dir=cache_dir)
+        metadata = first.extract_metadata()
+        modules = first.list_modules()
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        def fail(*args: object) -> None:
+            raise AssertionError("script was re-parsed")
+
+        monkeypatch.setattr(ScriptAnalyzer, "_metadata_heads", fail)
+        monkeypatch.setattr(ScriptAnalyzer, "analyze_module", fail)
+
+        second = ScriptAnalyzer(simple_script_file, cache_dir=cache_dir)
+        assert second.metadata == metadata
+        assert second.modules == modules
+        assert second.modules[0].imports == {"sims4", "sims4.commands"}
+
+    def test_cache_dir_invalidated_when_script_changes(
+        self, simple_script_file: Path, tmp_path: Path
+    ) -> None:
+        """Test that rewriting the script misses the stale cache entry."""
+        cache_dir = tmp_path / "cache"
+        assert len(ScriptAnalyzer(simple_script_file, cache_dir=cache_dir).list_modules()) == 1
+
+        with zipfile.ZipFile(simple_script_file, "a") as zf:
+            zf.writestr("extra_module.py", "import os\n")
+
+        modules = ScriptAnalyzer(simple_script_file, cache_dir=cache_dir).list_modules()
+        assert sorted(m.name for m in modules) == ["extra_module.py", "test_module.py"]
+
+    def test_cache_dir_ignores_other_schema_versions(
+        self, simple_script_file: Path, tmp_path: Path
+    ) -> None:
+        """Test entries written under another cache layout are treated as misses."""
+        cache_dir = tmp_path / "cache"
+        ScriptAnalyzer(simple_script_file, cache_dir=cache_dir).list_modules()
+        (cache_file,) = cache_dir.glob("*.json")
+        cache_file.write_text(json.dumps({"version": 0, "modules": [{"old": 1}]}))
+
+        modules = ScriptAnalyzer(simple_script_file, cache_dir=cache_dir).list_modules()
+
+        assert [m.name for m in modules] == ["test_module.py"]
+
+    def test_unusable_cache_dir_falls_back_to_parsing(
+        self, simple_script_file: Path, tmp_path: Path
+    ) -> None:
+        """Test a cache directory that cannot be created doesn't break analysis."""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+
+        analyzer = ScriptAnalyzer(simple_script_file, cache_dir=blocker / "cache")
+
+        assert analyzer.metadata.name == "Test Mod"
+        assert [m.name for m in analyzer.list_modules()] == ["test_module.py"]
+
+    def test_metadata_and_modules_share_one_archive(
+        self, simple_script_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that one archive handle serves metadata and modules until closed."""
+        opened: list[zipfile.ZipFile] = []
+        real_zipfile = zipfile.ZipFile
+
+        def tracking_zipfile(*args: object, **kwargs: object) -> zipfile.ZipFile:
+            zf = real_zipfile(*args, **kwargs)
+            opened.append(zf)
+            return zf
+
+        monkeypatch.setattr(zipfile, "ZipFile", tracking_zipfile)
+
+        with ScriptAnalyzer(simple_script_file) as analyzer:
+            assert len(analyzer.module_paths) == 1
+            assert analyzer.metadata.name == "Test Mod"
+            assert len(analyzer.modules) == 1
+
+        assert len(opened) == 1
+        assert opened[0].fp is None
+
+    def test_archive_closed_once_results_cached(self, simple_script_file: Path) -> None:
+        """Test the archive handle is released without ``with`` once both results exist."""
+        analyzer = ScriptAnalyzer(simple_script_file)
+
+        analyzer.extract_metadata()
+        assert analyzer._zip is not None
+
+        analyzer.list_modules()
+        assert analyzer._zip is None
@@ -62,8 +62,9 @@ def make_simdata() -> bytes:
     return bytes(payload)
 
 
-def test_parse_simdata_table_schema_and_column_metadata() -> None:
-    simdata = SimDataParser.parse(make_simdata())
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_parse_simdata_table_schema_and_column_metadata(wrap) -> None:
+    simdata = SimDataParser.parse(wrap(make_simdata()))
 
     assert simdata.parse_status == "parsed"
     assert simdata.version == 0x101
@@ -89,7 +90,7 @@ def test_parse_unsupported_version_degrades_without_tables() -> None:
     data = bytearray(make_simdata())
     data[4:8] = struct.pack("<I", 0x200)
 
-    simdata = SimDataParser.parse(bytes(data))
+    simdata = SimDataParser.parse(data)
 
     assert simdata.parse_status == "unsupported"
     assert simdata.version == 0x200
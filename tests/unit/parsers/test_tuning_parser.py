@@ -204,6 +204,32 @@ class TestTuningParser:
         assert tuning1.instance_id == tuning2.instance_id
         assert tuning1.tuning_name == tuning2.tuning_name
 
+    def test_identical_payloads_share_parse_result(
+        self, parser: TuningParser, simple_tuning_xml: bytes
+    ) -> None:
+        """Test a payload copied into another package reuses the earlier result."""
+        tuning = parser.parse(simple_tuning_xml)
+
+        assert parser.parse(bytes(bytearray(simple_tuning_xml))) is tuning
+        assert parser.parse(bytearray(simple_tuning_xml)) == tuning
+        assert TuningParser().parse(simple_tuning_xml) is not tuning
+
+        parser.clear_cache()
+        assert parser.parse(simple_tuning_xml) is not tuning
+
+    def test_shared_result_cannot_be_modified(
+        self, parser: TuningParser, complex_tuning_xml: bytes
+    ) -> None:
+        """Test the containers of a cached result are read-only."""
+        tuning = parser.parse(complex_tuning_xml)
+
+        with pytest.raises(TypeError):
+            tuning.modified_attributes["display_name"] = "changed"  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            tuning.references.add(1)  # type: ignore[attr-defined]
+        with pytest.raises(AttributeError):
+            tuning.pack_requirements.add("EP01")  # type: ignore[attr-defined]
+
     def test_empty_modifications(self, parser: TuningParser) -> None:
         """Test tuning with no modifications."""
         xml = b'<I c="Buff" i="test" s="123" m="buffs"></I>'
@@ -490,6 +490,22 @@ def test_function():
         # Version and author should be extracted from module
         # (might be None if metadata extraction fails, that's OK)
 
+    def test_scan_script_uses_script_cache_dir(self, sample_script: Path, tmp_path: Path) -> None:
+        """Test script results are cached and reused across scanners."""
+        cache_dir = tmp_path / "script_cache"
+        first = ModScanner(calculate_hashes=False, script_cache_dir=cache_dir).scan_file(
+            sample_script
+        )
+
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        second = ModScanner(calculate_hashes=False, script_cache_dir=cache_dir).scan_file(
+            sample_script
+        )
+        assert first is not None
+        assert second is not None
+        assert second.scripts == first.scripts
+
     def test_scan_script_without_parsing(self, scanner: ModScanner, sample_script: Path) -> None:
         """Test script scanning with parsing disabled."""
         scanner.parse_scripts = False
@@ -535,6 +551,17 @@ def test_function():
         assert len(mods1) == len(mods2)
         assert count1 == count2
 
+    def test_scan_directory_releases_tuning_cache(
+        self, scanner: ModScanner, sample_package: Path
+    ) -> None:
+        """Test cached tuning results don't outlive the scan that produced them."""
+        scanner.tuning_parser.parse(b'<I c="Buff" i="buff" m="buffs" s="1"></I>')
+        assert scanner.tuning_parser._cache
+
+        scanner.scan_directory(sample_package.parent)
+
+        assert not scanner.tuning_parser._cache
+
     def test_scan_mixed_directory(
         self, scanner: ModScanner, sample_package: Path, sample_script: Path
     ) -> None:
@@ -586,3 +613,39 @@ def test_function():
         if len(mods) >= 2:
             for i in range(len(mods) - 1):
                 assert mods[i].name <= mods[i + 1].name
+
+    def test_scan_directory_parallel_matches_sequential(
+        self, sample_package: Path, sample_script: Path, test_directory: Path
+    ) -> None:
+        """Test that scanning with worker processes gives the sequential results."""
+        for i in range(3):
+            (test_directory / f"copy_{i}.package").write_bytes(sample_package.read_bytes())
+        (test_directory / "corrupt.package").write_bytes(b"Not a valid DBPF file")
+
+        sequential = ModScanner()
+        parallel = ModScanner(workers=2)
+        progress: list[tuple[int, int, str]] = []
+
+        expected = sequential.scan_directory(test_directory)
+        mods = parallel.scan_directory(
+            test_directory, progress_callback=lambda *args: progress.append(args)
+        )
+
+        assert mods == expected
+        assert parallel.mods_scanned == sequential.mods_scanned
+        assert parallel.errors_encountered == sequential.errors_encountered
+        assert [name for _, _, name in progress[1:]] == [m.name for m in expected]
+
+    def test_find_mod_files_matches_suffix_case_insensitively(
+        self, scanner: ModScanner, test_directory: Path
+    ) -> None:
+        """Test that discovery ignores suffix case and skips folders named like mods."""
+        (test_directory / "Upper.PACKAGE").write_bytes(b"")
+        (test_directory / "Subfolder" / "nested.ts4script").write_bytes(b"")
+        (test_directory / "Folder.package").mkdir()
+
+        files = scanner._find_mod_files(test_directory, True, {".package", ".ts4script"})
+        flat = scanner._find_mod_files(test_directory, False, {".package", ".ts4script"})
+
+        assert [f.name for f in files] == ["nested.ts4script", "Upper.PACKAGE"]
+        assert [f.name for f in flat] == ["Upper.PACKAGE"]
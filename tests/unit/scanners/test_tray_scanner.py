@@ -0,0 +1,50 @@
+"""Tests for tray scanner."""
+
+import pytest
+
+from simanalysis.scanners.tray_scanner import TrayScanner
+
+pytestmark = pytest.mark.synthetic
+
+
+def test_extract_name_picks_longest_utf16_string() -> None:
+    content = (
+        b"\x08\x00\x00\x00"
+        + "Tray".encode("utf-16-le")
+        + b"\x00\x00\xff\xfe"
+        + "The Goth Family".encode("utf-16-le")
+        + b"\x00\x00"
+        + "Lot".encode("utf-16-le")
+    )
+
+    assert TrayScanner()._extract_name(content, "fallback") == "The Goth Family"
+
+
+def test_extract_name_falls_back_without_readable_text() -> None:
+    content = b"\x00\x00\x01\x02" + "Sim".encode("utf-16-le") + b"\x00\x00\x9a\xbc"
+
+    assert TrayScanner()._extract_name(content, "0x1234") == "0x1234"
+
+
+def test_scan_directory_groups_files_by_tray_item_prefix(tmp_path) -> None:
+    for name in [
+        "0x1!0xa.trayitem",
+        "0x1!0xa.householdbinary",
+        "0x1!0xa.hhi",
+        "0x1!0xb.trayitem",
+        "0x1!0xb.blueprint",
+        "0x1!0xb.bpi",
+    ]:
+        (tmp_path / name).write_bytes(b"\x00" * 8)
+
+    items = {item.files[0].stem: item for item in TrayScanner().scan_directory(tmp_path)}
+
+    assert sorted(items) == ["0x1!0xa", "0x1!0xb"]
+    assert items["0x1!0xa"].type == "Household"
+    assert {f.name for f in items["0x1!0xa"].files} == {
+        "0x1!0xa.trayitem",
+        "0x1!0xa.householdbinary",
+        "0x1!0xa.hhi",
+    }
+    assert items["0x1!0xb"].type == "Lot"
+    assert len(items["0x1!0xb"].files) == 3
@@ -2,6 +2,7 @@
 
 import json
 import re
+import shutil
 import struct
 import zlib
 from pathlib import Path
@@ -12,18 +13,39 @@ from click.testing import CliRunner
 from simanalysis.cli import cli
 
 
+def _build_package_header() -> bytes:
+    """Build the minimal 96-byte DBPF header shared by the CLI test packages."""
+    header = bytearray(96)
+    header[0:4] = b"DBPF"
+    header[4:8] = struct.pack("<I", 2)  # major_version
+    header[40:44] = struct.pack("<I", 1)  # index_count
+    header[44:48] = struct.pack("<I", 96)  # index_offset
+    header[48:52] = struct.pack("<I", 32)  # index_size
+    return bytes(header)
+
+
+# Built once at import; every test package shares the header and resource bytes
+_PACKAGE_HEADER = _build_package_header()
+_RESOURCE_DATA = b"Test resource"
+_COMPRESSED_RESOURCE = zlib.compress(_RESOURCE_DATA)
+_RESOURCE_OFFSET = 96 + 32
+
+# Index entry: type, group, instance, offset, compressed size, uncompressed size
+_INDEX_ENTRY_STRUCT = struct.Struct("<IIQIII")
+
+
 class TestCLI:
     """Tests for CLI commands."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def runner(self) -> CliRunner:
-        """Create CLI test runner."""
+        """Create CLI test runner (stateless between invokes, so shared by the class)."""
         return CliRunner()
 
-    @pytest.fixture
-    def test_mods_dir(self, tmp_path: Path) -> Path:
-        """Create test mods directory with sample files."""
-        mods_dir = tmp_path / "Mods"
+    @pytest.fixture(scope="session")
+    def template_mods_dir(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Write the sample packages once per session; tests get their own copy."""
+        mods_dir = tmp_path_factory.mktemp("mods_template") / "Mods"
         mods_dir.mkdir()
 
         # Create two test package files
@@ -33,37 +55,48 @@ class TestCLI:
 
         return mods_dir
 
+    @pytest.fixture(scope="class")
+    def json_report(
+        self,
+        runner: CliRunner,
+        template_mods_dir: Path,
+        tmp_path_factory: pytest.TempPathFactory,
+    ) -> tuple[int, Path]:
+        """Run 'analyze --format json' on the sample mods once; return (exit code, report)."""
+        output_file = tmp_path_factory.mktemp("json_report") / "report.json"
+        result = runner.invoke(
+            cli,
+            [
+                "analyze",
+                str(template_mods_dir),
+                "--output",
+                str(output_file),
+                "--format",
+                "json",
+            ],
+        )
+        return result.exit_code, output_file
+
+    @pytest.fixture
+    def test_mods_dir(self, template_mods_dir: Path, tmp_path: Path) -> Path:
+        """Create test mods directory with sample files."""
+        # Copied per test, since some tests add packages or subfolders to it
+        return Path(shutil.copytree(template_mods_dir, tmp_path / "Mods"))
+
     def _create_test_package(self, path: Path, tuning_id: int = 0x12345678) -> None:
         """Create a minimal test package file."""
-        # Create minimal DBPF file (96-byte header)
-        header = bytearray(96)
-        header[0:4] = b"DBPF"
-        header[4:8] = struct.pack("<I", 2)  # major_version
-        header[40:44] = struct.pack("<I", 1)  # index_count
-        header[44:48] = struct.pack("<I", 96)  # index_offset
-        header[48:52] = struct.pack("<I", 32)  # index_size
-
-        # Create resource
-        resource_data = b"Test resource"
-        compressed_data = zlib.compress(resource_data)
-        resource_offset = 96 + 32
-
-        # Create index entry
-        index_entry = struct.pack(
-            "<IIQIII",
+        # Create index entry; only the instance varies between packages
+        index_entry = _INDEX_ENTRY_STRUCT.pack(
             0x12345678,
             0x00000000,
             tuning_id,
-            resource_offset,
-            len(compressed_data),
-            len(resource_data),
+            _RESOURCE_OFFSET,
+            len(_COMPRESSED_RESOURCE),
+            len(_RESOURCE_DATA),
         )
 
-        # Write file
-        with open(path, "wb") as f:
-            f.write(header)
-            f.write(index_entry)
-            f.write(compressed_data)
+        # Write file in one call
+        path.write_bytes(_PACKAGE_HEADER + index_entry + _COMPRESSED_RESOURCE)
 
     def test_cli_version(self, runner: CliRunner) -> None:
         """Test --version flag."""
@@ -95,14 +128,6 @@ class TestCLI:
         assert "--output" in result.output
         assert "--format" in result.output
 
-    def test_analyze_basic(self, runner: CliRunner, test_mods_dir: Path) -> None:
-        """Test basic analyze command."""
-        result = runner.invoke(cli, ["analyze", str(test_mods_dir)])
-        assert result.exit_code in [0, 1]  # May exit 1 if critical conflicts found
-        assert "Analyzing" in result.output
-        assert "ANALYSIS RESULTS" in result.output
-        assert "Total Mods Found" in result.output
-
     def test_analyze_with_output_txt(
         self, runner: CliRunner, test_mods_dir: Path, tmp_path: Path
     ) -> None:
@@ -116,56 +141,29 @@ class TestCLI:
         assert "MOD ANALYSIS REPORT" in content
         assert "SUMMARY" in content
 
-    def test_analyze_with_output_json(
-        self, runner: CliRunner, test_mods_dir: Path, tmp_path: Path
+    @pytest.mark.parametrize(
+        ("extra_args", "expected"),
+        [
+            pytest.param([], ["Analyzing", "ANALYSIS RESULTS", "Total Mods Found"], id="basic"),
+            pytest.param(["--quick"], ["Analyzing"], id="quick"),
+            pytest.param(["--no-tunings"], ["Analyzing"], id="no-tunings"),
+            pytest.param(["--no-scripts"], ["Analyzing"], id="no-scripts"),
+            pytest.param(["--verbose"], ["Starting analysis", "Parse tunings"], id="verbose"),
+            pytest.param(["--verbose", "--workers", "2"], ["Workers: 2"], id="workers"),
+        ],
+    )
+    def test_analyze_flags(
+        self,
+        runner: CliRunner,
+        test_mods_dir: Path,
+        extra_args: list[str],
+        expected: list[str],
     ) -> None:
-        """Test analyze with JSON output."""
-        output_file = tmp_path / "report.json"
-        result = runner.invoke(
-            cli,
-            [
-                "analyze",
-                str(test_mods_dir),
-                "--output",
-                str(output_file),
-                "--format",
-                "json",
-            ],
-        )
-        assert result.exit_code in [0, 1]
-        assert output_file.exists()
-
-        # Verify JSON structure
-        with open(output_file, encoding="utf-8") as f:
-            data = json.load(f)
-        assert "summary" in data
-        assert "mods" in data
-        assert "conflicts" in data
-
-    def test_analyze_quick_mode(self, runner: CliRunner, test_mods_dir: Path) -> None:
-        """Test analyze with --quick flag."""
-        result = runner.invoke(cli, ["analyze", str(test_mods_dir), "--quick"])
-        assert result.exit_code in [0, 1]
-        assert "Analyzing" in result.output
-
-    def test_analyze_no_tunings(self, runner: CliRunner, test_mods_dir: Path) -> None:
-        """Test analyze with --no-tunings flag."""
-        result = runner.invoke(cli, ["analyze", str(test_mods_dir), "--no-tunings"])
-        assert result.exit_code in [0, 1]
-        assert "Analyzing" in result.output
-
-    def test_analyze_no_scripts(self, runner: CliRunner, test_mods_dir: Path) -> None:
-        """Test analyze with --no-scripts flag."""
-        result = runner.invoke(cli, ["analyze", str(test_mods_dir), "--no-scripts"])
-        assert result.exit_code in [0, 1]
-        assert "Analyzing" in result.output
-
-    def test_analyze_verbose(self, runner: CliRunner, test_mods_dir: Path) -> None:
-        """Test analyze with --verbose flag."""
-        result = runner.invoke(cli, ["analyze", str(test_mods_dir), "--verbose"])
-        assert result.exit_code in [0, 1]
-        assert "Starting analysis" in result.output
-        assert "Parse tunings" in result.output
+        """Test analyze with each mode flag."""
+        result = runner.invoke(cli, ["analyze", str(test_mods_dir), *extra_args])
+        assert result.exit_code in [0, 1]  # May exit 1 if critical conflicts found
+        for text in expected:
+            assert text in result.output
 
     def test_analyze_non_recursive(self, runner: CliRunner, test_mods_dir: Path) -> None:
         """Test analyze with --no-recursive flag."""
@@ -205,24 +203,11 @@ class TestCLI:
         assert result.exit_code == 0
         assert "Scanning" in result.output
 
-    def test_view_json_report(self, runner: CliRunner, test_mods_dir: Path, tmp_path: Path) -> None:
+    def test_view_json_report(self, runner: CliRunner, json_report: tuple[int, Path]) -> None:
         """Test view command with JSON report."""
-        # First create a report
-        output_file = tmp_path / "report.json"
-        result = runner.invoke(
-            cli,
-            [
-                "analyze",
-                str(test_mods_dir),
-                "--output",
-                str(output_file),
-                "--format",
-                "json",
-            ],
-        )
+        _, output_file = json_report
         assert output_file.exists()
 
-        # Now view it
         result = runner.invoke(cli, ["view", str(output_file)])
         assert result.exit_code == 0
         assert "REPORT SUMMARY" in result.output
@@ -991,23 +976,10 @@ class TestCLI:
             or "Error" in result.output
         )
 
-    def test_analyze_creates_valid_json_report(
-        self, runner: CliRunner, test_mods_dir: Path, tmp_path: Path
-    ) -> None:
+    def test_analyze_creates_valid_json_report(self, json_report: tuple[int, Path]) -> None:
         """Test that JSON report is valid and complete."""
-        output_file = tmp_path / "report.json"
-        result = runner.invoke(
-            cli,
-            [
-                "analyze",
-                str(test_mods_dir),
-                "--output",
-                str(output_file),
-                "--format",
-                "json",
-            ],
-        )
-        assert result.exit_code in [0, 1]
+        exit_code, output_file = json_report
+        assert exit_code in [0, 1]
 
         # Verify JSON structure
         with open(output_file, encoding="utf-8") as f:
@@ -0,0 +1,16 @@
+"""Tests for the interactive Textual app."""
+
+from pathlib import Path
+
+from simanalysis.interactive_tui import SimanalysisApp
+
+
+def test_app_keeps_scan_options(tmp_path: Path) -> None:
+    """Test the app stores scan options without clobbering Textual's own attributes."""
+    cache_dir = tmp_path / "script_cache"
+
+    app = SimanalysisApp(tmp_path, workers=2, script_cache_dir=cache_dir)
+
+    assert app.scan_workers == 2
+    assert app.script_cache_dir == cache_dir
+    assert app.mods_directory == tmp_path
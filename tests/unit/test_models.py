@@ -196,7 +196,7 @@ class TestMod:
             type=ModType.PACKAGE,
             size=1024000,
             hash="abc123",
-            resources=[
+            resources=(
                 DBPFResource(
                     type=int(TUNING_GENERIC),
                     group=0x00000000,
@@ -211,7 +211,7 @@ class TestMod:
                     offset=2000,
                     size=600,
                 ),
-            ],
+            ),
         )
 
         resource_keys = mod.resource_keys
@@ -241,17 +241,21 @@ class TestModConflict:
 class TestAnalysisResult:
     """Tests for AnalysisResult model."""
 
-    def test_get_conflicts_by_severity(self) -> None:
-        """Test filtering conflicts by severity."""
-        metadata = AnalysisMetadata(
-            timestamp=datetime.now(timezone.utc),
+    @pytest.fixture(scope="class")
+    def metadata(self) -> AnalysisMetadata:
+        """Analysis metadata shared by the tests; none of them modify it."""
+        return AnalysisMetadata(
+            timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
             version="2.0.0",
             mod_directory="/mods",
             analysis_duration_seconds=10.5,
             total_mods_analyzed=100,
         )
 
-        performance = PerformanceMetrics(
+    @pytest.fixture(scope="class")
+    def performance(self) -> PerformanceMetrics:
+        """Performance metrics shared by the tests; none of them modify them."""
+        return PerformanceMetrics(
             total_mods=100,
             total_size_mb=500.0,
             total_resources=1000,
@@ -262,6 +266,10 @@ class TestAnalysisResult:
             complexity_score=65.5,
         )
 
+    def test_get_conflicts_by_severity(
+        self, metadata: AnalysisMetadata, performance: PerformanceMetrics
+    ) -> None:
+        """Test filtering conflicts by severity."""
         conflicts = [
             ModConflict(
                 id="c1",
@@ -301,27 +309,10 @@ class TestAnalysisResult:
         high_conflicts = result.get_conflicts(severity=Severity.HIGH)
         assert len(high_conflicts) == 1
 
-    def test_get_conflicts_by_type(self) -> None:
+    def test_get_conflicts_by_type(
+        self, metadata: AnalysisMetadata, performance: PerformanceMetrics
+    ) -> None:
         """Test filtering conflicts by type."""
-        metadata = AnalysisMetadata(
-            timestamp=datetime.now(timezone.utc),
-            version="2.0.0",
-            mod_directory="/mods",
-            analysis_duration_seconds=10.5,
-            total_mods_analyzed=100,
-        )
-
-        performance = PerformanceMetrics(
-            total_mods=100,
-            total_size_mb=500.0,
-            total_resources=1000,
-            total_tunings=200,
-            total_scripts=50,
-            estimated_load_time_seconds=30.0,
-            estimated_memory_mb=250.0,
-            complexity_score=65.5,
-        )
-
         conflicts = [
             ModConflict(
                 id="c1",
@@ -351,27 +342,10 @@ class TestAnalysisResult:
         tuning_conflicts = result.get_conflicts(type=ConflictType.TUNING_OVERLAP)
         assert len(tuning_conflicts) == 2
 
-    def test_critical_conflicts_property(self) -> None:
+    def test_critical_conflicts_property(
+        self, metadata: AnalysisMetadata, performance: PerformanceMetrics
+    ) -> None:
         """Test critical_conflicts property."""
-        metadata = AnalysisMetadata(
-            timestamp=datetime.now(timezone.utc),
-            version="2.0.0",
-            mod_directory="/mods",
-            analysis_duration_seconds=10.5,
-            total_mods_analyzed=100,
-        )
-
-        performance = PerformanceMetrics(
-            total_mods=100,
-            total_size_mb=500.0,
-            total_resources=1000,
-            total_tunings=200,
-            total_scripts=50,
-            estimated_load_time_seconds=30.0,
-            estimated_memory_mb=250.0,
-            complexity_score=65.5,
-        )
-
         conflicts = [
             ModConflict(
                 id="c1",
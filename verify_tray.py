@@ -8,15 +8,18 @@ def create_dummy_tray_files(directory: Path):
     """Create dummy tray files for testing."""
     directory.mkdir(parents=True, exist_ok=True)
 
-    # Household Item
-    (directory / "0x00000000_0x0000000000000001.trayitem").write_text("Household Name")
-    (directory / "0x00000000_0x0000000000000001.hhi").touch()
-    (directory / "0x00000000_0x0000000000000001.sgi").touch()
-
-    # Lot Item
-    (directory / "0x00000000_0x0000000000000002.trayitem").write_text("Lot Name")
-    (directory / "0x00000000_0x0000000000000002.blueprint").touch()
-    (directory / "0x00000000_0x0000000000000002.bpi").touch()
+    files = [
+        # Household Item
+        ("0x00000000_0x0000000000000001.trayitem", b"Household Name"),
+        ("0x00000000_0x0000000000000001.hhi", b""),
+        ("0x00000000_0x0000000000000001.sgi", b""),
+        # Lot Item
+        ("0x00000000_0x0000000000000002.trayitem", b"Lot Name"),
+        ("0x00000000_0x0000000000000002.blueprint", b""),
+        ("0x00000000_0x0000000000000002.bpi", b""),
+    ]
+    for name, content in files:
+        (directory / name).write_bytes(content)
 
 
 def verify_tray_analysis():